@@ -1,2 +1,18 @@
 @echo off
-for /f "tokens=*" %%i in ('aske activate') do %%i 
\ No newline at end of file
+rem Activate the nearest project venv without starting Python
+set "ASKE_DIR=%CD%"
+:aske_search
+if exist "%ASKE_DIR%\venv\Scripts\activate.bat" goto aske_found
+for %%i in ("%ASKE_DIR%\..") do set "ASKE_PARENT=%%~fi"
+if /i "%ASKE_PARENT%"=="%ASKE_DIR%" goto aske_missing
+set "ASKE_DIR=%ASKE_PARENT%"
+goto aske_search
+:aske_found
+set "ASKE_PARENT="
+call "%ASKE_DIR%\venv\Scripts\activate.bat"
+set "ASKE_DIR="
+goto :eof
+:aske_missing
+echo aske: no venv found in %CD% or its parents 1>&2
+set "ASKE_DIR="
+set "ASKE_PARENT="
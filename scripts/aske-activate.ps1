@@ -1 +1,12 @@
-& $(aske activate) 
\ No newline at end of file
+# Dot-source this file to activate the nearest project venv without starting Python.
+# For a permanent aske-activate command use: aske shell-init pwsh | Out-String | Invoke-Expression
+$AskeDir = (Get-Location).ProviderPath
+while ($AskeDir -and -not (Test-Path -LiteralPath (Join-Path $AskeDir 'venv/Scripts/Activate.ps1'))) {
+    $AskeDir = Split-Path -Parent $AskeDir
+}
+if ($AskeDir) {
+    . (Join-Path $AskeDir 'venv/Scripts/Activate.ps1')
+} else {
+    Write-Error "aske: no venv found in $((Get-Location).ProviderPath) or its parents"
+}
+Remove-Variable AskeDir
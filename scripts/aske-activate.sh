@@ -1,2 +1,13 @@
 #!/bin/bash
-eval "$(aske activate)" 
\ No newline at end of file
+# Source this file to activate the nearest project venv without starting Python.
+# For a permanent aske-activate command use: eval "$(aske shell-init bash)"
+_aske_dir="$PWD"
+while [ -n "$_aske_dir" ] && [ ! -f "$_aske_dir/venv/bin/activate" ]; do
+  _aske_dir="${_aske_dir%/*}"
+done
+if [ -n "$_aske_dir" ]; then
+  . "$_aske_dir/venv/bin/activate"
+else
+  echo "aske: no venv found in $PWD or its parents" >&2
+fi
+unset _aske_dir
@@ -0,0 +1,226 @@
+"""In-process project generation for tools that embed aske instead of running it
+
+generate() renders a framework's project files under a destination directory.
+It never changes the working directory or prints, and keeps no state between
+calls apart from the shared generation cache (whose entries are published
+atomically), so any number of generations can run in threads at once.
+
+    from aske.api import generate
+    result = generate('go', 'shop-api', '/srv/projects/shop-api', {'framework': 'chi'})
+    result.manifest  # ['go.mod', 'cmd/main/main.go', ...]
+
+Dependency installs and the Rails and Laravel skeletons run external tools;
+they stay in the CLI, which uses generate() for the files of each project.
+"""
+import importlib
+import os
+import time
+
+from aske.core.cache import materialize_generated, use_yarn_offline_mirror, write_files
+from aske.core.models import ExpressModel, NextjsModel, NodejsModel, PythonModel, SpringModel
+
+# Options each framework accepts, with their defaults
+FRAMEWORK_OPTIONS = {
+    'python': {},
+    'node': {},
+    'next': {'perf': False},
+    'express': {},
+    'java': {'perf': False, 'datasource': None},
+    'go': {'framework': 'gin'},
+}
+
+class GenerationResult:
+    """What generate() wrote and how long each phase took
+
+    manifest lists the files written, relative to project_path; timings maps
+    each phase to its duration in seconds; warnings holds the problems that
+    did not stop the generation.
+    """
+
+    def __init__(self, framework, name, project_path, options):
+        self.framework = framework
+        self.name = name
+        self.project_path = project_path
+        self.options = options
+        self.manifest = []
+        self.directories = []
+        self.timings = {}
+        self.warnings = []
+        self.cached = False
+
+    def timed(self, phase, func, *args):
+        """Run one phase of the generation and record its duration"""
+        started = time.monotonic()
+        try:
+            return func(*args)
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.monotonic() - started
+
+
+def get_go_model(framework):
+    """Get the model of a Go web framework, or None if it has none"""
+    if framework == 'pure':
+        from aske.core.models.go import GoModel
+        return GoModel
+    try:
+        module = importlib.import_module(f'aske.core.models.go.{framework}')
+        return getattr(module, f'{framework.title()}Model')
+    except (ImportError, AttributeError):
+        return None
+
+
+def get_go_renderers(model_class, framework, name):
+    """Map the paths of the files of a Go project to functions rendering them"""
+    if framework == 'revel':
+        return {
+            'go.mod': lambda: model_class.get_mod_file(name),
+            'app/controllers/app.go': model_class.get_app_controller,
+            'conf/app.conf': model_class.get_app_conf,
+            'conf/routes': model_class.get_routes,
+            'main.go': model_class.get_main_file,  # Add main.go in root
+            '.env': model_class.get_env,
+            '.gitignore': model_class.get_gitignore,
+            'README.md': lambda: model_class.get_readme(name),
+            'Makefile': model_class.get_makefile,
+            'build/package/Dockerfile': lambda: model_class.get_dockerfile(name),
+            '.dockerignore': model_class.get_dockerignore,
+        }
+    return {
+        'go.mod': lambda: model_class.get_mod_file(name),
+        'cmd/main/main.go': model_class.get_main_file,
+        'cmd/main/pprof.go': model_class.get_pprof_file,
+        'test/load/main.go': model_class.get_load_test,
+        '.env': model_class.get_env,
+        '.gitignore': model_class.get_gitignore,
+        'README.md': lambda: model_class.get_readme(name),
+        'Makefile': model_class.get_makefile,
+        'build/package/Dockerfile': model_class.get_dockerfile,
+        '.dockerignore': model_class.get_dockerignore,
+    }
+
+
+def get_node_renderers(name):
+    """Map the paths of the files of a Node.js project to functions rendering them"""
+    return {
+        'package.json': lambda: NodejsModel.get_package_json(name),
+        '.prettierrc': NodejsModel.get_prettierrc,
+        '.eslintrc': NodejsModel.get_eslintrc,
+        'src/index.js': NodejsModel.get_index_js,
+        '.env': NodejsModel.get_env
+    }
+
+
+def get_express_renderers(name):
+    """Map the paths of the files of an Express.js API project to functions rendering them"""
+    return {
+        'package.json': lambda: ExpressModel.get_package_json(name),
+        '.env': ExpressModel.get_env,
+        'src/server.js': ExpressModel.get_server_js,
+        'src/app.js': ExpressModel.get_app_js,
+        'src/routes/index.js': ExpressModel.get_routes_index,
+        'src/routes/health.routes.js': ExpressModel.get_health_routes,
+        'src/routes/user.routes.js': ExpressModel.get_user_routes,
+        'src/controllers/user.controller.js': ExpressModel.get_user_controller,
+        'src/middleware/errorHandler.js': ExpressModel.get_error_handler,
+        'src/utils/logger.js': ExpressModel.get_logger,
+    }
+
+
+def get_python_renderers(name):
+    """Map the paths of the files of a Python project to functions rendering them"""
+    return {
+        'requirements.txt': PythonModel.get_requirements,
+        '.env': lambda: PythonModel.get_env(name),
+        'app.py': lambda: PythonModel.get_app(name)
+    }
+
+
+def get_directories(framework, name):
+    """Directories a framework's project has besides those holding its files"""
+    if framework == 'node':
+        return ['src/controllers', 'src/models', 'src/routes', 'src/middlewares', 'tests']
+    if framework == 'express':
+        return ['src/controllers', 'src/routes', 'src/middleware', 'src/utils',
+                'src/models', 'src/services', 'tests', 'logs']
+    if framework == 'java':
+        package = name.lower()
+        return [f'{root}/controller' for root in (f'src/main/java/com/example/{package}',
+                                                  f'src/test/java/com/example/{package}',
+                                                  'src/main/resources')]
+    return []
+
+
+def write_generated(result, generator, cache_options, renderers):
+    """Write the files of renderers(name) to the project through the generation cache
+
+    An unusable cache (read-only home, full disk...) only costs the reuse, so
+    the files are then written directly and a warning is recorded.
+    """
+    try:
+        files, result.cached = materialize_generated(generator, cache_options, renderers,
+                                                     result.name, result.project_path)
+    except OSError as e:
+        result.warnings.append(f"Generation cache unavailable ({e}); wrote files directly")
+        files = renderers(result.name)
+        write_files(result.project_path, {file_path: render() for file_path, render in files.items()})
+    result.manifest.extend(files)
+
+
+def generate(framework, name, dest, options=None):
+    """Generate a framework's project files in dest and return a GenerationResult
+
+    name is the project name the templates are rendered with; options are the
+    framework's flags (see FRAMEWORK_OPTIONS), e.g. {'perf': True} for next.
+    Raises ValueError for an unknown framework or option.
+    """
+    if framework not in FRAMEWORK_OPTIONS:
+        raise ValueError(f"Unknown framework '{framework}'; choose from {', '.join(FRAMEWORK_OPTIONS)}")
+    unknown = sorted(set(options or {}) - set(FRAMEWORK_OPTIONS[framework]))
+    if unknown:
+        raise ValueError(f"Unknown options for {framework}: {', '.join(unknown)}")
+    options = {**FRAMEWORK_OPTIONS[framework], **(options or {})}
+
+    result = GenerationResult(framework, name, os.path.abspath(dest), options)
+    started = time.monotonic()
+
+    def make_directories(directories):
+        os.makedirs(result.project_path, exist_ok=True)
+        for directory in directories:
+            os.makedirs(os.path.join(result.project_path, directory), exist_ok=True)
+        result.directories.extend(directories)
+
+    result.timed('structure', make_directories, get_directories(framework, name))
+
+    if framework == 'python':
+        result.timed('files', write_generated, result, 'python', {}, get_python_renderers)
+    elif framework == 'node':
+        result.timed('files', write_generated, result, 'node', {}, get_node_renderers)
+    elif framework == 'express':
+        result.timed('files', write_generated, result, 'express', {}, get_express_renderers)
+    elif framework == 'next':
+        perf = options['perf']
+        result.timed('files', write_generated, result, 'next', {'perf': perf},
+                     lambda project_name: NextjsModel.get_project_renderers(project_name, perf))
+    elif framework == 'java':
+        perf, datasource = options['perf'], options['datasource']
+        result.timed('files', write_generated, result, 'java', {'perf': perf, 'datasource': datasource},
+                     lambda project_name: SpringModel.get_project_renderers(project_name, perf=perf,
+                                                                            datasource=datasource))
+    elif framework == 'go':
+        go_framework = options['framework']
+        model_class = get_go_model(go_framework)
+        if model_class is None:
+            result.warnings.append(f"Framework {go_framework} not yet supported; used Gin")
+            from aske.core.models.go.gin import GinModel
+            model_class = GinModel
+        result.manifest.extend(result.timed('structure', model_class.create_project_structure,
+                                            result.project_path))
+        result.timed('files', write_generated, result, 'go', {'model': model_class.__name__},
+                     lambda project_name: get_go_renderers(model_class, go_framework, project_name))
+
+    if framework in ('node', 'next', 'express'):
+        result.timed('files', use_yarn_offline_mirror, result.project_path)
+        result.manifest.append('.yarnrc')
+
+    result.timings['total'] = time.monotonic() - started
+    return result
@@ -1,27 +1,69 @@
 import click
+import yaml
 import os
 import subprocess
 import sys
 import shutil
+import signal
 import time
 import re
-import importlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from aske import __version__
 from aske.core.models import (
     GitignoreModel,
-    PythonModel,
     NodejsModel,
     NextjsModel,
     ExpressModel,
     RubyModel,
     SpringModel,
     LaravelModel,
-    GoBaseModel
+    GoBaseModel,
+    ShellModel
 )
+from aske.core import Platform
+from aske.api import generate, get_go_model
+from aske.client import get_socket_path
+from aske.core.cache import (
+    build_laravel_skeleton,
+    build_rails_skeleton,
+    cache_key,
+    configure_bundler,
+    create_rails_credentials,
+    get_cache_dir,
+    get_laravel_skeleton,
+    get_maven_wrapper_template,
+    get_rails_skeleton,
+    install_maven_wrapper,
+    is_maven_warm,
+    is_yarn_warm,
+    mark_maven_warm,
+    materialize_laravel_skeleton,
+    materialize_rails_skeleton,
+    restore_gemfile_lock,
+    save_gemfile_lock,
+    use_maven_repository,
+    use_yarn_offline_mirror,
+    write_files,
+    yarn_install
+)
+from aske.core.dev import DevRunner, detect_target, get_package_json
+from aske.core.engine import Engine, StepError, run_probes
+from aske.core.state import GenerationState
+from aske.daemon import get_pid, is_running, serve
+from aske.core.permissions import fix_permissions
 from aske.core.sol.mysql import MySQLModel
 from aske.core.sol.postgresql import PostgreSQLModel
 from aske.core.sol.mongodb import MongoDBModel
 
+# Project name used to render the dependency-cache seed projects
+CACHE_SEED = 'aske-seed'
+
+# Component types `aske platform up` can scaffold, i.e. aske commands
+PLATFORM_GENERATORS = ['python', 'node', 'next', 'express', 'ruby', 'java', 'php', 'go', 'sol']
+
+# laravel/laravel version constraint the cached PHP skeleton is built from
+LARAVEL_VERSION = '^11.0'
+
 # Add color constants
 RED = "\033[91m"
 ORANGE = "\033[93m"
@@ -40,6 +82,83 @@ def success_text(message):
     """Format success message in green"""
     return f"{GREEN}{message}{RESET}"
 
+def install_node_dependencies(project_path, package_json):
+    """Install a Node project's dependencies through the shared yarn mirror"""
+    click.echo("\n📦 Installing dependencies...")
+    try:
+        if yarn_install(project_path, package_json):
+            click.echo("✓ Installed dependencies offline from the shared mirror")
+        else:
+            click.echo("✓ Installed dependencies (lockfile cached for offline installs)")
+        return True
+    except (subprocess.CalledProcessError, OSError) as e:
+        click.echo(error_text(f"\n❌ Error installing dependencies: {e}"), err=True)
+        click.echo("\nInstall them manually:")
+        click.echo(command_text(f"cd {os.path.basename(project_path)} && yarn install"))
+        return False
+
+def install_project_dependencies(state, project_path):
+    """Run the checkpointed yarn install of a generated Node project"""
+    if state.is_done('install'):
+        return True
+    with open(os.path.join(project_path, 'package.json')) as f:
+        package_json = f.read()
+    if not install_node_dependencies(project_path, package_json):
+        echo_resume_hint(state.name)
+        return False
+    state.done('install')
+    return True
+
+def start_generation(command, name, resume, options):
+    """Check the project directory and return the checkpoints to record steps in
+
+    A fresh run needs a new directory; with resume (set by `aske resume`) the
+    checkpoints of the interrupted run are loaded instead.
+    """
+    project_path = os.path.abspath(name)
+    if resume:
+        state = GenerationState.load(project_path)
+        if state is None:
+            click.echo(error_text(f"❌ Error: No interrupted generation found in '{name}'"), err=True)
+            sys.exit(1)
+        return state
+    if os.path.exists(project_path):
+        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
+        try:
+            interrupted = GenerationState.load(project_path)
+        except ValueError:
+            interrupted = None
+        if interrupted is not None and not interrupted.finished:
+            click.echo("\nAn earlier generation of this project stopped part-way. Continue it with:")
+            click.echo(command_text(f"aske resume {name}"))
+        else:
+            click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
+        sys.exit(1)
+    return GenerationState(project_path, command, name, options)
+
+def echo_generated(result):
+    """Report the files an aske.api generation wrote"""
+    for file_path in result.manifest:
+        click.echo(f"📄 Created {file_path}")
+    if result.cached:
+        click.echo("⚡ Reused cached template files")
+    for warning in result.warnings:
+        click.echo(error_text(f"⚠️  {warning}"), err=True)
+
+def echo_probe_timeouts(probes):
+    """Report the tool probes that timed out; returns True if any did"""
+    timed_out = [result for result in probes.values() if result.timed_out]
+    for result in timed_out:
+        click.echo(error_text(f"\n❌ `{' '.join(result.command)}` did not answer within {result.timeout:g}s"))
+    if timed_out:
+        click.echo("\nCheck that these commands work in your terminal, then try again.")
+    return bool(timed_out)
+
+def echo_resume_hint(name):
+    """Tell the user how to continue a generation that stopped at a failed step"""
+    click.echo("\nOnce the problem is fixed, continue from the failed step with:")
+    click.echo(command_text(f"aske resume {name}"))
+
 def change_directory(path):
     """Change directory and return success status"""
     try:
@@ -303,7 +422,12 @@ class AuxiliaryGroup(click.Group):
     def get_help(self, ctx):
         return f"""Auxiliary:
   activate  Find the Python virtual environment
-  init      Initialize git repository with .gitignore"""
+  init      Initialize git repository with .gitignore
+  dev       Run the project and rebuild it on every change
+  resume    Continue an interrupted project generation
+  cache     Manage shared dependency caches
+  platform  Scaffold a multi-component platform
+  daemon    Keep aske warm in the background for aske-client"""
 
 # Modify the main group to use custom formatting
 class MainGroup(click.Group):
@@ -327,7 +451,7 @@ class MainGroup(click.Group):
         
         # Auxiliary section
         formatter.write_text("Auxiliary:")
-        for cmd_name in ['activate', 'init']:
+        for cmd_name in ['activate', 'shell-init', 'init', 'dev', 'resume', 'cache', 'platform', 'daemon']:
             cmd = self.get_command(ctx, cmd_name)
             if cmd:
                 formatter.write_text(f"  {cmd_name:<8} {cmd.help}")
@@ -350,22 +474,18 @@ main.add_command(sol)
 
 @main.command()
 @click.argument('name')
-def python(name):
+@click.option('--resume', is_flag=True, hidden=True)
+def python(name, resume):
     """Create a new Python project and set up its structure"""
     project_path = os.path.abspath(name)
-    
-    # Check if project already exists
-    if os.path.exists(project_path):
-        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
-        click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
-        sys.exit(1)
+    state = start_generation('python', name, resume, {})
     
     click.echo(f"\n🚀 Creating new Python project: {name}")
     click.echo("=" * 50)
 
     # Create project directory
     click.echo(f"📁 Creating project directory: {project_path}")
-    os.makedirs(project_path, exist_ok=False)
+    state.begin()
     
     # Create virtual environment
     click.echo("\n🔧 Setting up Python virtual environment...")
@@ -387,27 +507,36 @@ def python(name):
         click.echo(error_text("❌ Error: Could not find Python executable"), err=True)
         return
 
+    def write_project_files():
+        result = generate('python', name, project_path)
+        state.done('files')
+        return result
+
+    # The venv and the project files do not depend on each other
+    engine = Engine()
+    if not state.is_done('venv'):
+        # --clear replaces whatever an interrupted run left behind
+        engine.add('venv', command=[python_executable, "-m", "venv", "--clear", os.path.join(project_path, "venv")])
+    if not state.is_done('files'):
+        engine.add('files', func=write_project_files)
     try:
-        venv_path = os.path.join(project_path, "venv")
-        subprocess.run([python_executable, "-m", "venv", venv_path], check=True)
-        click.echo("✓ Virtual environment created successfully")
-    except Exception as e:
-        click.echo(error_text(f"❌ Error creating virtual environment: {e}"), err=True)
+        results = engine.run()
+    except StepError as e:
+        click.echo(error_text(f"❌ Error setting up project ({e})"), err=True)
+        if e.output:
+            click.echo(e.output.strip(), err=True)
+        echo_resume_hint(name)
         return
+    if 'venv' in results:
+        state.done('venv')
+        click.echo("✓ Virtual environment created successfully")
+    else:
+        click.echo("✓ Virtual environment already created")
 
-    # Create project structure
-    click.echo("\n✓ Creating project files...")
-    files = {
-        'requirements.txt': PythonModel.get_requirements(),
-        '.env': PythonModel.get_env(name),
-        'app.py': PythonModel.get_app(name)
-    }
-
-    for file_name, content in files.items():
-        full_path = os.path.join(project_path, file_name)
-        click.echo(f"📄 Creating {file_name}")
-        with open(full_path, 'w') as f:
-            f.write(content)
+    if 'files' in results:
+        click.echo("\n✓ Creating project files...")
+        echo_generated(results['files'].value)
+    state.finish()
 
     click.echo("\n✨ Project structure created successfully!")
     click.echo(f"\nTo start working on your project:")
@@ -418,7 +547,6 @@ def python(name):
     click.echo(command_text("aske init    # To initialize git and create .gitignore"))
 
 @main.command()
-@click.argument('name')
 def activate():
     """Activate the Python virtual environment"""
     click.echo("\n🚀 Activating virtual environment...")
@@ -441,7 +569,66 @@ def activate():
 
     # Print the command that needs to be evaluated by the shell
     click.echo(command_text(activate_cmd))
-    
+
+
+@main.command('shell-init')
+@click.argument('shell', type=click.Choice(['bash', 'zsh', 'fish', 'pwsh']))
+@click.option('--auto', is_flag=True, help='Activate the nearest venv whenever the directory changes')
+def shell_init(shell, auto):
+    """Print a Python-free venv activation hook for your shell"""
+    click.echo(ShellModel.get_init(shell, auto), nl=False)
+
+
+def detect_stacks(path):
+    """Detect the stacks a project uses from their manifest files, e.g. ['go', 'node']"""
+    def exists(*names):
+        return any(os.path.exists(os.path.join(path, name)) for name in names)
+
+    stacks = []
+    if exists('go.mod'):
+        stacks.append('go')
+    if exists('pom.xml', 'build.gradle', 'build.gradle.kts'):
+        stacks.append('java')
+    if exists('composer.json', 'artisan'):
+        stacks.append('php')
+    if exists('package.json'):
+        stacks.append('next' if 'next' in get_package_json(path).get('dependencies', {}) else 'node')
+    if exists('requirements.txt', 'pyproject.toml', 'setup.py', 'app.py', 'venv'):
+        stacks.append('python')
+    return stacks
+
+def get_git_version():
+    """Get the installed git version as a tuple, e.g. (2, 45, 1)"""
+    result = subprocess.run(['git', '--version'], capture_output=True, text=True, check=True)
+    match = re.search(r'(\d+)\.(\d+)(?:\.(\d+))?', result.stdout)
+    return tuple(int(part or 0) for part in match.groups()) if match else (0, 0, 0)
+
+def is_fsmonitor_supported():
+    """Check whether git has a built-in filesystem monitor on this platform"""
+    # Unsupported platforms exit with 128; git before 2.37 has no such command
+    result = subprocess.run(['git', 'fsmonitor--daemon', 'status'], capture_output=True, text=True)
+    return result.returncode != 128 and 'not a git command' not in result.stderr
+
+def tune_git_repository():
+    """Enable the git settings that keep status and log fast in large working trees
+
+    Returns the settings applied, as (key, value) pairs.
+    """
+    settings = [
+        # Index v4 and the untracked cache: status skips unchanged directories
+        ('feature.manyFiles', 'true'),
+        ('core.untrackedCache', 'true'),
+        # Keep a commit-graph file so log and merge-base walk it instead of objects
+        ('core.commitGraph', 'true'),
+        ('gc.writeCommitGraph', 'true'),
+        ('fetch.writeCommitGraph', 'true'),
+    ]
+    if get_git_version() >= (2, 37) and is_fsmonitor_supported():
+        # The built-in daemon reports changed files, so status does not scan the tree
+        settings.append(('core.fsmonitor', 'true'))
+    for key, value in settings:
+        subprocess.run(['git', 'config', key, value], check=True)
+    return settings
 
 @main.command()
 def init():
@@ -458,10 +645,19 @@ def init():
         subprocess.run(['git', 'init'], check=True)
         click.echo(success_text("✓ Git repository initialized"))
 
-        # Create or update .gitignore
+        # Keep git fast as the working tree grows
+        for key, value in tune_git_repository():
+            click.echo(f"⚡ Set {key}={value}")
+
+        # Create or update .gitignore with the rules of every detected stack
+        stacks = detect_stacks(os.getcwd()) or ['python']
+        click.echo(f"🔍 Detected stacks: {', '.join(stacks)}")
         click.echo("📄 Creating/updating .gitignore file...")
-        with open('.gitignore', 'w') as f:
-            f.write(GitignoreModel.get_python_gitignore())
+        existing = ''
+        if os.path.exists('.gitignore'):
+            with open('.gitignore') as f:
+                existing = f.read()
+        write_files(os.getcwd(), {'.gitignore': GitignoreModel.get_gitignore(stacks, existing)})
         click.echo(success_text("✓ Created/updated .gitignore file"))
 
         # Add files to git
@@ -482,15 +678,12 @@ def init():
 
 @main.command()
 @click.argument('name')
-def node(name):
+@click.option('--install', is_flag=True, help='Install dependencies from the shared yarn mirror')
+@click.option('--resume', is_flag=True, hidden=True)
+def node(name, install, resume):
     """Create a new Node.js project and set up its structure"""
     project_path = os.path.abspath(name)
-    
-    # Check if project already exists
-    if os.path.exists(project_path):
-        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
-        click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
-        sys.exit(1)
+    state = start_generation('node', name, resume, {'install': install})
     
     # Check if nvm is installed by looking for .nvm directory
     home = os.path.expanduser("~")
@@ -518,44 +711,34 @@ def node(name):
     click.echo("=" * 50)
 
     # Create project directory and structure
-    os.makedirs(project_path)
-    for dir_name in ['src/controllers', 'src/models', 'src/routes', 'src/middlewares', 'tests']:
-        os.makedirs(os.path.join(project_path, dir_name))
-
-    # Create project files
-    files = {
-        'package.json': NodejsModel.get_package_json(name),
-        '.prettierrc': NodejsModel.get_prettierrc(),
-        '.eslintrc': NodejsModel.get_eslintrc(),
-        'src/index.js': NodejsModel.get_index_js(),
-        '.env': NodejsModel.get_env()
-    }
+    state.begin()
+    if not state.is_done('files'):
+        # Name-independent files come from the generation cache
+        echo_generated(generate('node', name, project_path))
+        state.done('files')
 
-    for file_path, content in files.items():
-        full_path = os.path.join(project_path, file_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, 'w') as f:
-            f.write(content)
-            click.echo(f"📄 Created {file_path}")
+    installed = install and install_project_dependencies(state, project_path)
+    if not install or installed:
+        state.finish()
 
     click.echo("\n✨ Project structure created successfully!")
     click.echo("\nNext steps:")
     click.echo(command_text(f"cd {name}"))
-    click.echo(command_text("yarn install  # Install dependencies"))
+    if not installed:
+        click.echo(command_text("yarn install  # Install dependencies"))
     click.echo(command_text("yarn dev      # Start development server"))
     click.echo(command_text("aske init     # Initialize git repository"))
 
 @main.command()
 @click.argument('name')
-def next(name):
+@click.option('--perf', is_flag=True,
+              help='Performance preset: standalone output, server-component page, bundle analyzer')
+@click.option('--install', is_flag=True, help='Install dependencies from the shared yarn mirror')
+@click.option('--resume', is_flag=True, hidden=True)
+def next(name, perf, install, resume):
     """Create a new Next.js project with TypeScript"""
     project_path = os.path.abspath(name)
-    
-    # Check if project already exists
-    if os.path.exists(project_path):
-        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
-        click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
-        sys.exit(1)
+    state = start_generation('next', name, resume, {'perf': perf, 'install': install})
     
     # Check if nvm is installed
     home = os.path.expanduser("~")
@@ -583,54 +766,34 @@ def next(name):
     click.echo("=" * 50)
 
     try:
-        # Create Next.js project with TypeScript
-        click.echo("\n📦 Creating Next.js project with TypeScript...")
-        subprocess.run([
-            'npx', 
-            'create-next-app@latest', 
-            name, 
-            '--typescript', 
-            '--use-yarn',
-            '--no-git',  # Don't initialize git - we'll use aske init
-            '--src-dir',  # Use src directory structure
-            '--import-alias', '@/*'  # Modern import alias
-        ], check=True)
-
-        # Wait a moment for file system to sync
-        time.sleep(1)
-
-        # Create ModelPrompt component
-        component_path = os.path.join(project_path, 'src/components/ModelPrompt.tsx')
-        os.makedirs(os.path.dirname(component_path), exist_ok=True)
-        with open(component_path, 'w') as f:
-            f.write(NextjsModel.get_model_prompt_component())
-        click.echo("✓ Created ModelPrompt component")
-
-        # Update index page - check both possible locations
-        index_paths = [
-            os.path.join(project_path, 'src/app/page.tsx'),  # New app directory
-            os.path.join(project_path, 'src/pages/index.tsx')  # Traditional pages directory
-        ]
-        
-        index_path = None
-        for path in index_paths:
-            if os.path.exists(os.path.dirname(path)):
-                index_path = path
-                break
-
-        if index_path:
-            with open(index_path, 'w') as f:
-                f.write(NextjsModel.get_index_page())
-            click.echo(f"✓ Updated index page at {os.path.relpath(index_path, project_path)}")
-        else:
-            click.echo(error_text("❌ Could not find index page location"))
+        # Render the Next.js skeleton (app router, TypeScript, src dir, @/* alias)
+        state.begin()
+        if not state.is_done('files'):
+            click.echo("\n📦 Creating Next.js project with TypeScript...")
+            result = generate('next', name, project_path, {'perf': perf})
+
+            missing = [file_path for file_path in result.manifest
+                       if not os.path.isfile(os.path.join(project_path, file_path))]
+            if missing:
+                click.echo(error_text(f"❌ Missing generated files: {', '.join(missing)}"), err=True)
+                echo_resume_hint(name)
+                return
+            echo_generated(result)
+            state.done('files')
+
+        installed = install and install_project_dependencies(state, project_path)
+        if not install or installed:
+            state.finish()
 
         click.echo("\n✨ Next.js project created successfully!")
         click.echo("\nNext steps:")
         click.echo(command_text(f"cd {name}"))
-        click.echo(command_text("yarn install     # Install dependencies"))
-        click.echo(command_text("yarn dev        # Start development server"))
-        click.echo(command_text("aske init       # Initialize git repository"))
+        if not installed:
+            click.echo(command_text("yarn install --prefer-offline  # Install dependencies"))
+        click.echo(command_text("yarn dev                      # Start development server"))
+        if perf:
+            click.echo(command_text("yarn analyze                  # Inspect client and server bundles"))
+        click.echo(command_text("aske init                     # Initialize git repository"))
 
     except subprocess.CalledProcessError as e:
         click.echo(error_text(f"\n❌ Error creating Next.js project: {e}"), err=True)
@@ -641,15 +804,12 @@ def next(name):
 
 @main.command()
 @click.argument('name')
-def express(name):
+@click.option('--install', is_flag=True, help='Install dependencies from the shared yarn mirror')
+@click.option('--resume', is_flag=True, hidden=True)
+def express(name, install, resume):
     """Create a new Express.js API project"""
     project_path = os.path.abspath(name)
-    
-    # Check if project already exists
-    if os.path.exists(project_path):
-        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
-        click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
-        sys.exit(1)
+    state = start_generation('express', name, resume, {'install': install})
     
     # Check for NVM and Yarn (reuse existing checks)
     # ... NVM and Yarn checks ...
@@ -659,50 +819,24 @@ def express(name):
 
     try:
         # Create project structure
-        os.makedirs(project_path)
-        
-        # Create directory structure
-        directories = [
-            'src/controllers',
-            'src/routes',
-            'src/middleware',
-            'src/utils',
-            'src/models',
-            'src/services',
-            'tests',
-            'logs'
-        ]
-        
-        for dir_name in directories:
-            dir_path = os.path.join(project_path, dir_name)
-            os.makedirs(dir_path)
-            click.echo(f"📁 Created {dir_name}")
-
-        # Create project files
-        files = {
-            'package.json': ExpressModel.get_package_json(name),
-            '.env': ExpressModel.get_env(),
-            'src/server.js': ExpressModel.get_server_js(),
-            'src/app.js': ExpressModel.get_app_js(),
-            'src/routes/index.js': ExpressModel.get_routes_index(),
-            'src/routes/health.routes.js': ExpressModel.get_health_routes(),
-            'src/routes/user.routes.js': ExpressModel.get_user_routes(),
-            'src/controllers/user.controller.js': ExpressModel.get_user_controller(),
-            'src/middleware/errorHandler.js': ExpressModel.get_error_handler(),
-            'src/utils/logger.js': ExpressModel.get_logger(),
-        }
-
-        for file_path, content in files.items():
-            full_path = os.path.join(project_path, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, 'w') as f:
-                f.write(content)
-            click.echo(f"📄 Created {file_path}")
+        state.begin()
+        if not state.is_done('files'):
+            # Name-independent files come from the generation cache
+            result = generate('express', name, project_path)
+            for dir_name in result.directories:
+                click.echo(f"📁 Created {dir_name}")
+            echo_generated(result)
+            state.done('files')
+
+        installed = install and install_project_dependencies(state, project_path)
+        if not install or installed:
+            state.finish()
 
         click.echo("\n✨ Express.js API project created successfully!")
         click.echo("\nNext steps:")
         click.echo(command_text(f"cd {name}"))
-        click.echo(command_text("yarn install     # Install dependencies"))
+        if not installed:
+            click.echo(command_text("yarn install     # Install dependencies"))
         click.echo(command_text("yarn dev        # Start development server"))
         click.echo(command_text("aske init       # Initialize git repository"))
 
@@ -712,7 +846,9 @@ def express(name):
 
 @main.command()
 @click.argument('name')
-def ruby(name):
+@click.option('--yes', '-y', is_flag=True, help='Skip the confirmation prompt')
+@click.option('--resume', is_flag=True, hidden=True)
+def ruby(name, yes, resume):
     """Create a new Ruby on Rails project"""
     
     # Add warning and confirmation prompt
@@ -723,29 +859,37 @@ def ruby(name):
     click.echo("3. Install Rails and its dependencies")
     click.echo("4. Modify shell configuration files")
     
-    if not click.confirm('\nDo you want to continue?', default=False):
+    if not yes and not click.confirm('\nDo you want to continue?', default=False):
         click.echo("\nOperation cancelled.")
         return
         
     project_path = os.path.abspath(name)
+    state = start_generation('ruby', name, resume, {'yes': True})
     
-    # Check if project already exists
-    if os.path.exists(project_path):
-        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
-        click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
-        sys.exit(1)
-    
+    # Probe rbenv, Ruby, Rails, Bundler and PostgreSQL together
+    probes = run_probes({
+        'rbenv': ['rbenv', 'version'],
+        'rbenv_root': ['rbenv', 'root'],
+        'ruby': ['ruby', '-v'],
+        'rails': ['rails', '-v'],
+        'bundle': ['bundle', '-v'],
+        'psql': ['psql', '--version'],
+        'services': ['brew', 'services', 'list'],
+    })
+    if echo_probe_timeouts(probes):
+        return
+
     # Check if rbenv is installed and properly configured
     try:
-        rbenv_version = subprocess.run(['rbenv', 'version'], capture_output=True, text=True).stdout
+        rbenv_version = probes['rbenv'].check_found().output
         click.echo(f"✓ rbenv detected: {rbenv_version.strip()}")
         
         # Get the active Ruby version from rbenv
         rbenv_ruby_version = rbenv_version.split()[0]  # Get just the version number
         
         # Check if we're actually using rbenv's Ruby
-        which_ruby = subprocess.run(['which', 'ruby'], capture_output=True, text=True).stdout.strip()
-        ruby_version = subprocess.run(['ruby', '-v'], capture_output=True, text=True).stdout
+        which_ruby = shutil.which('ruby') or ''
+        ruby_version = probes['ruby'].output
         
         if '.rbenv/shims/ruby' in which_ruby and rbenv_ruby_version >= "3.2.0":
             click.echo(f"✓ Using rbenv Ruby {rbenv_ruby_version}: {which_ruby}")
@@ -775,9 +919,9 @@ def ruby(name):
 
     # Check if Rails is installed with correct Ruby
     try:
-        result = subprocess.run(['rails', '-v'], capture_output=True, text=True)
-        if result.returncode == 0 and 'Rails' in result.stdout:
-            click.echo(f"✓ Rails detected: {result.stdout.strip()}")
+        result = probes['rails'].check_found()
+        if result.returncode == 0 and 'Rails' in result.output:
+            click.echo(f"✓ Rails detected: {result.output.strip()}")
         else:
             click.echo(error_text("\n❌ Rails is not properly installed!"))
             click.echo("\nLet's install Rails:")
@@ -800,7 +944,7 @@ def ruby(name):
 
     # Check if Bundler is installed
     try:
-        bundler_version = subprocess.run(['bundle', '-v'], capture_output=True, text=True).stdout
+        bundler_version = probes['bundle'].check_found().output
         click.echo(f"✓ Bundler detected: {bundler_version.strip()}")
     except FileNotFoundError:
         click.echo(error_text("\n❌ Bundler is not installed!"))
@@ -810,11 +954,11 @@ def ruby(name):
 
     # Check if PostgreSQL is installed and running
     try:
-        psql_version = subprocess.run(['psql', '--version'], capture_output=True, text=True).stdout
+        psql_version = probes['psql'].check_found().output
         click.echo(f"✓ PostgreSQL detected: {psql_version.strip()}")
         
         # Check if PostgreSQL service is running
-        pg_status = subprocess.run(['brew', 'services', 'list'], capture_output=True, text=True).stdout
+        pg_status = probes['services'].check_found().output
         if 'postgresql@14' not in pg_status or 'started' not in pg_status:
             click.echo(error_text("\n⚠️  PostgreSQL service is not running!"))
             click.echo("\nStart PostgreSQL service with:")
@@ -833,23 +977,25 @@ def ruby(name):
         return
 
     # Check and fix rbenv permissions before creating project
+    if not probes['rbenv_root'].ok or not probes['rbenv_root'].output.strip():
+        click.echo(error_text("\n❌ Could not determine the rbenv root!"))
+        click.echo("\nCheck that this prints your rbenv directory:")
+        click.echo(command_text("rbenv root"))
+        return
     try:
-        rbenv_root = subprocess.run(['rbenv', 'root'], capture_output=True, text=True).stdout.strip()
+        rbenv_root = probes['rbenv_root'].output.strip()
+        gems_dir = os.path.join(rbenv_root, "versions", "3.2.0", "lib", "ruby", "gems")
         click.echo("\n🔧 Checking rbenv permissions...")
         
-        # Fix permissions for the entire rbenv directory
-        subprocess.run([
-            'sudo', 'chown', '-R', os.environ['USER'], rbenv_root
-        ], check=True)
-        
-        # Fix permissions for the gems directory
-        gems_dir = os.path.join(rbenv_root, "versions", "3.2.0", "lib", "ruby", "gems")
-        if os.path.exists(gems_dir):
-            subprocess.run([
-                'chmod', '-R', '755', gems_dir
-            ], check=True)
-            
-        click.echo("✓ Fixed rbenv permissions")
+        # Only entries that are wrong get fixed; sudo is used only for foreign-owned ones
+        mode_roots = [gems_dir] if os.path.exists(gems_dir) else []
+        result = fix_permissions(rbenv_root, mode_roots=mode_roots, user=os.environ['USER'])
+        if result['cached']:
+            click.echo("✓ rbenv permissions unchanged since last check")
+        elif result['chowned'] or result['chmodded']:
+            click.echo(f"✓ Fixed rbenv permissions ({result['chowned']} ownership, {result['chmodded']} mode)")
+        else:
+            click.echo("✓ rbenv permissions are correct")
         
     except subprocess.CalledProcessError as e:
         click.echo(error_text(f"\n❌ Error fixing permissions: {e}"))
@@ -870,35 +1016,65 @@ def ruby(name):
         env = os.environ.copy()
         env['RBENV_VERSION'] = '3.2.0'  # Set Ruby version for this process
         
-        subprocess.run([
-            'rails', 'new', name,
+        rails_options = [
             '--database=postgresql',
             '--api',
             '--skip-git',  # We'll use aske init
             '--skip-bundle',  # We'll run bundle install later
             '--rails-version=7.1.0'  # Specify Rails version explicitly
-        ], check=True, env=env)
+        ]
+
+        # `rails new` only runs on a cache miss; later projects copy the cached skeleton
+        state.begin()
+        if not state.is_done('skeleton'):
+            skeleton = get_rails_skeleton(rails_options, env['RBENV_VERSION'])
+            if skeleton is None:
+                click.echo("📦 Rendering Rails skeleton (cached for future projects)...")
+                skeleton = build_rails_skeleton(rails_options, env['RBENV_VERSION'], env=env)
+            else:
+                click.echo("✓ Using cached Rails skeleton")
+            state.clean()
+            materialize_rails_skeleton(skeleton, project_path, name)
+            state.done('skeleton')
+        else:
+            click.echo("✓ Rails skeleton already in place")
 
         # Create additional files
-        files = {
-            'Gemfile': RubyModel.get_gemfile(),
-            '.rubocop.yml': RubyModel.get_rubocop(),
-            '.rspec': RubyModel.get_rspec(),
-            '.env': RubyModel.get_env(),
-            'README.md': RubyModel.get_readme(name),
-            'config/application.rb': RubyModel.get_application_rb(name)
-        }
-
-        for file_path, content in files.items():
-            full_path = os.path.join(project_path, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, 'w') as f:
-                f.write(content)
-            click.echo(f"📄 Created {file_path}")
-
-        # Install dependencies
-        click.echo("\n📦 Installing dependencies...")
-        subprocess.run(['bundle', 'install'], cwd=project_path, check=True, env=env)
+        if not state.is_done('files'):
+            files = {
+                'Gemfile': RubyModel.get_gemfile(),
+                '.rubocop.yml': RubyModel.get_rubocop(),
+                '.rspec': RubyModel.get_rspec(),
+                '.env': RubyModel.get_env(),
+                'README.md': RubyModel.get_readme(name),
+                'config/application.rb': RubyModel.get_application_rb(name),
+                'config/boot.rb': RubyModel.get_boot_rb(),
+                'config/puma.rb': RubyModel.get_puma_rb(),
+                'config/database.yml': RubyModel.get_database_yml(name)
+            }
+
+            write_files(project_path, files)
+            for file_path in files:
+                click.echo(f"📄 Created {file_path}")
+            state.done('files')
+
+        # Install dependencies into the shared gem store, reusing the resolved lockfile
+        if not state.is_done('bundle'):
+            click.echo("\n📦 Installing dependencies...")
+            gemfile = RubyModel.get_gemfile()
+            jobs = os.cpu_count() or 4
+            configure_bundler(project_path, env['RBENV_VERSION'], jobs)
+            if restore_gemfile_lock(gemfile, env['RBENV_VERSION'], project_path):
+                click.echo("✓ Reusing cached Gemfile.lock")
+            subprocess.run(['bundle', 'install', f'--jobs={jobs}'], cwd=project_path, check=True, env=env)
+            save_gemfile_lock(gemfile, env['RBENV_VERSION'], project_path)
+            state.done('bundle')
+
+        # The skeleton ships without credentials; encrypt this app's own secret_key_base
+        if not state.is_done('credentials'):
+            create_rails_credentials(project_path, env=env)
+            click.echo("🔐 Created config/credentials.yml.enc with a new secret_key_base")
+            state.done('credentials')
 
         # Create a script to set up the environment
         setup_script = '''#!/bin/bash
@@ -909,6 +1085,7 @@ rbenv shell 3.2.0
         with open(setup_script_path, 'w') as f:
             f.write(setup_script)
         os.chmod(setup_script_path, 0o755)  # Make executable
+        state.finish()
 
         click.echo("\n✨ Ruby on Rails project created successfully!")
         click.echo("\nNext steps:")
@@ -920,10 +1097,13 @@ rbenv shell 3.2.0
         click.echo("\nThen set up the database:")
         click.echo(command_text("rails db:create db:migrate   # Setup database"))
         click.echo(command_text("rails server                # Start the server"))
+        click.echo("\nIn production, Puma runs one worker per core (WEB_CONCURRENCY) with YJIT:")
+        click.echo(command_text("RAILS_ENV=production RUBY_YJIT_ENABLE=1 bundle exec puma -C config/puma.rb"))
         click.echo(command_text("aske init                  # Initialize git repository"))
 
     except subprocess.CalledProcessError as e:
         click.echo(error_text(f"\n❌ Error creating Rails project: {e}"), err=True)
+        echo_resume_hint(name)
         return
     except Exception as e:
         click.echo(error_text(f"\n❌ Unexpected error: {e}"), err=True)
@@ -931,20 +1111,28 @@ rbenv shell 3.2.0
 
 @main.command()
 @click.argument('name')
-def java(name):
+@click.option('--perf', is_flag=True,
+              help='Java 21 performance profile: virtual threads, AOT processing and CDS')
+@click.option('--datasource', type=click.Choice(['postgresql', 'mysql']),
+              help='Add a JDBC datasource with a tuned HikariCP pool')
+@click.option('--resume', is_flag=True, hidden=True)
+def java(name, perf, datasource, resume):
     """Create a new Spring Boot project"""
     project_path = os.path.abspath(name)
+    state = start_generation('java', name, resume, {'perf': perf, 'datasource': datasource})
     
-    # Check if project already exists
-    if os.path.exists(project_path):
-        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
-        click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
-        sys.exit(1)
-    
+    # Probe Java and, when the wrapper template is not cached yet, Maven together
+    probe_commands = {'java': ['java', '-version']}
+    if get_maven_wrapper_template() is None:
+        probe_commands['mvn'] = ['mvn', '-version']
+    probes = run_probes(probe_commands)
+    if echo_probe_timeouts(probes):
+        return
+
     # Check if Java is installed
     try:
         # Java outputs version to stderr by default
-        java_version = subprocess.run(['java', '-version'], capture_output=True, text=True).stderr
+        java_version = probes['java'].check_found().error
         if 'Unable to locate a Java Runtime' in java_version:
             click.echo(error_text("\n❌ Java Runtime not found!"))
             click.echo("\nOpenJDK is installed but not properly linked. Please run these commands:")
@@ -960,6 +1148,11 @@ def java(name):
             return
         elif java_version:
             click.echo(f"✓ Java detected: {java_version.split('\\n')[0]}")
+            version_match = re.search(r'version "(\d+)', java_version)
+            if perf and version_match and int(version_match.group(1)) < 21:
+                click.echo(error_text("\n⚠️  --perf targets Java 21 (virtual threads, CDS)."))
+                click.echo("\nInstall Java 21 before building the project:")
+                click.echo(command_text("brew install openjdk@21"))
         else:
             raise FileNotFoundError("Java not found")
     except (FileNotFoundError, subprocess.CalledProcessError):
@@ -969,64 +1162,65 @@ def java(name):
         click.echo("\nThen follow the steps above to link Java properly.")
         return
 
-    # Check if Maven is installed
-    try:
-        mvn_version = subprocess.run(['mvn', '-version'], capture_output=True, text=True).stdout
-        click.echo(f"✓ Maven detected: {mvn_version.split('\\n')[0]}")
-    except FileNotFoundError:
-        click.echo(error_text("\n❌ Maven is not installed!"))
-        click.echo("\nPlease install Maven first:")
-        click.echo(command_text("brew install maven"))
-        return
+    # Check if Maven is installed (only needed to generate the wrapper template)
+    if 'mvn' in probes:
+        try:
+            mvn_version = probes['mvn'].check_found().output
+            click.echo(f"✓ Maven detected: {mvn_version.split('\\n')[0]}")
+        except FileNotFoundError:
+            click.echo(error_text("\n❌ Maven is not installed!"))
+            click.echo("\nPlease install Maven first:")
+            click.echo(command_text("brew install maven"))
+            return
+    else:
+        click.echo("✓ Using cached Maven wrapper")
 
     click.echo(f"\n🚀 Creating new Spring Boot project: {name}")
     click.echo("=" * 50)
 
     try:
         # Create project structure
-        os.makedirs(project_path)
-        package_path = os.path.join(project_path, "src", "main", "java", "com", "example", name.lower())
-        test_path = os.path.join(project_path, "src", "test", "java", "com", "example", name.lower())
-        resources_path = os.path.join(project_path, "src", "main", "resources")
-        
-        for path in [package_path, test_path, resources_path]:
-            os.makedirs(os.path.join(path, "controller"), exist_ok=True)
-            
-        # Create project files
-        files = {
-            'pom.xml': SpringModel.get_pom_xml(name),
-            os.path.join(package_path, 'Application.java'): SpringModel.get_application_class(name),
-            os.path.join(package_path, 'controller', 'HelloController.java'): SpringModel.get_hello_controller(name),
-            os.path.join(package_path, 'controller', 'CustomErrorController.java'): SpringModel.get_error_controller(name),
-            os.path.join(test_path, 'ApplicationTests.java'): SpringModel.get_application_test(name),
-            os.path.join(test_path, 'controller', 'HelloControllerTest.java'): SpringModel.get_hello_controller_test(name),
-            os.path.join(resources_path, 'application.properties'): SpringModel.get_application_properties(),
-            'README.md': SpringModel.get_readme(name)
-        }
-
-        for file_path, content in files.items():
-            full_path = os.path.join(project_path, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, 'w') as f:
-                f.write(content)
-            click.echo(f"📄 Created {file_path}")
-
-        # Download Maven wrapper
-        click.echo("\n📦 Setting up Maven wrapper...")
-        subprocess.run(['mvn', '-N', 'wrapper:wrapper'], cwd=project_path, check=True)
+        state.begin()
+        if not state.is_done('files'):
+            # Name-independent files come from the generation cache
+            echo_generated(generate('java', name, project_path, {'perf': perf, 'datasource': datasource}))
+            state.done('files')
+
+        # Copy the cached Maven wrapper and share one local repository across projects
+        if not state.is_done('wrapper'):
+            click.echo("\n📦 Setting up Maven wrapper...")
+            if install_maven_wrapper(project_path):
+                click.echo("✓ Copied Maven wrapper from cache")
+            use_maven_repository(project_path)
+            state.done('wrapper')
+        state.finish()
+        offline = is_maven_warm(SpringModel.get_pom_xml(CACHE_SEED, perf=perf, datasource=datasource))
 
         click.echo("\n✨ Spring Boot project created successfully!")
         click.echo("\nNext steps:")
         click.echo(command_text(f"cd {name}"))
-        click.echo(command_text("./mvnw clean install  # Build the project"))
+        if offline:
+            click.echo(command_text("./mvnw -o clean install  # Build offline from the shared cache"))
+        else:
+            click.echo(command_text("./mvnw clean install  # Build the project"))
         click.echo(command_text("./mvnw spring-boot:run  # Run the application"))
+        if perf:
+            click.echo(command_text("./mvnw -Pnative-ready package  # Build with AOT and a CDS archive"))
         click.echo(command_text("aske init  # Initialize git repository"))
+        if datasource:
+            click.echo(f"\nThe datasource expects {datasource} on localhost. Start one with:")
+            click.echo(command_text(f"aske sol {datasource} {name}-db"))
+        if not offline:
+            click.echo("\nTo build future projects offline, warm the dependency cache once:")
+            click.echo(command_text("aske cache warm java" + (" --perf" if perf else "") +
+                                    (f" --datasource {datasource}" if datasource else "")))
         click.echo("\nThen visit either:")
         click.echo("http://localhost:8080")
         click.echo("http://localhost:8080/hello")
 
     except subprocess.CalledProcessError as e:
         click.echo(error_text(f"\n❌ Error creating Spring Boot project: {e}"), err=True)
+        echo_resume_hint(name)
         return
     except Exception as e:
         click.echo(error_text(f"\n❌ Unexpected error: {e}"), err=True)
@@ -1034,22 +1228,31 @@ def java(name):
 
 @main.command()
 @click.argument('name')
-def php(name):
+@click.option('--perf', is_flag=True,
+              help='Performance profile: Octane on RoadRunner, OPcache JIT and preload, redis drivers')
+@click.option('--resume', is_flag=True, hidden=True)
+def php(name, perf, resume):
     """Create a new Laravel project"""
     project_path = os.path.abspath(name)
+    state = start_generation('php', name, resume, {'perf': perf})
     
-    # Check if project already exists
-    if os.path.exists(project_path):
-        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
-        click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
-        sys.exit(1)
-    
+    # Probe Apache, PHP and Composer together
+    probes = run_probes({
+        'httpd': ['brew', 'list', 'httpd'],
+        'httpd_version': ['/opt/homebrew/bin/httpd', '-v'],
+        'services': ['brew', 'services', 'list'],
+        'php': ['php', '-v'],
+        'composer': ['composer', '--version'],
+    })
+    if echo_probe_timeouts(probes):
+        return
+
     # Check if Apache is installed and running
     try:
         # First check if Homebrew Apache is installed
         try:
-            subprocess.run(['brew', 'list', 'httpd'], capture_output=True, check=True)
-            apache_version = subprocess.run(['/opt/homebrew/bin/httpd', '-v'], capture_output=True, text=True).stdout
+            probes['httpd'].check_returncode()
+            apache_version = probes['httpd_version'].check_found().output
             click.echo(f"✓ Homebrew Apache detected: {apache_version.split('\\n')[0]}")
         except subprocess.CalledProcessError:
             click.echo(error_text("\n⚠️  Homebrew Apache (httpd) is not installed!"))
@@ -1065,7 +1268,7 @@ def php(name):
             return
         
         # Check if Homebrew Apache is running
-        apache_status = subprocess.run(['brew', 'services', 'list'], capture_output=True, text=True).stdout
+        apache_status = probes['services'].check_found().output
         if 'httpd' not in apache_status or 'started' not in apache_status:
             click.echo(error_text("\n⚠️  Homebrew Apache service is not running!"))
             click.echo("\nStart Apache service with:")
@@ -1096,16 +1299,17 @@ def php(name):
     try:
         # First check where PHP is installed
         try:
-            php_path = subprocess.run(['which', 'php'], capture_output=True, text=True).stdout.strip()
+            php_path = shutil.which('php')
             if not php_path:
                 raise FileNotFoundError("PHP not found in PATH")
             click.echo(f"✓ PHP found at: {php_path}")
             
             # Now check PHP version
-            php_version = subprocess.run([php_path, '-v'], capture_output=True, text=True).stdout
+            php_version = probes['php'].check_found().output
             version_match = re.search(r'PHP (\d+\.\d+)', php_version)
             if version_match:
-                version = float(version_match.group(1))
+                php_minor = version_match.group(1)
+                version = float(php_minor)
                 if version < 8.2:
                     click.echo(error_text(f"\n❌ PHP version {version} is too old. Version 8.2 or higher is required."))
                     click.echo("\nPlease install PHP 8.2:")
@@ -1135,7 +1339,7 @@ def php(name):
             raise FileNotFoundError("PHP not found")
         
         # Check if PHP service is running
-        php_status = subprocess.run(['brew', 'services', 'list'], capture_output=True, text=True).stdout
+        php_status = probes['services'].check_found().output
         if 'php@8.2' not in php_status and 'php' not in php_status:
             click.echo(error_text("\n⚠️  PHP service is not running!"))
             click.echo("\nStart PHP service with:")
@@ -1170,7 +1374,7 @@ def php(name):
 
     # Check if Composer is installed
     try:
-        composer_version = subprocess.run(['composer', '--version'], capture_output=True, text=True).stdout
+        composer_version = probes['composer'].check_found().output
         click.echo(f"✓ Composer detected: {composer_version.split('\\n')[0]}")
     except FileNotFoundError:
         click.echo(error_text("\n❌ Composer is not installed!"))
@@ -1182,55 +1386,96 @@ def php(name):
     click.echo("=" * 50)
 
     try:
-        # Create Laravel project using Composer
-        click.echo("\n📦 Creating Laravel project...")
-        subprocess.run([
-            'composer', 'create-project', '--prefer-dist', 'laravel/laravel', name
-        ], check=True)
-
-        # Create HelloController
-        controller_path = os.path.join(project_path, 'app', 'Http', 'Controllers', 'HelloController.php')
-        os.makedirs(os.path.dirname(controller_path), exist_ok=True)
-        with open(controller_path, 'w') as f:
-            f.write(LaravelModel.get_hello_controller())
-        click.echo("✓ Created HelloController")
-
-        # Create HelloController test
-        test_path = os.path.join(project_path, 'tests', 'Feature', 'HelloControllerTest.php')
-        os.makedirs(os.path.dirname(test_path), exist_ok=True)
-        with open(test_path, 'w') as f:
-            f.write(LaravelModel.get_hello_test())
-        click.echo("✓ Created HelloController test")
-
-        # Add hello route to web.php
-        routes_path = os.path.join(project_path, 'routes', 'web.php')
-        with open(routes_path, 'a') as f:
-            f.write("\nRoute::get('/hello', [App\\Http\\Controllers\\HelloController::class, 'index']);")
-        click.echo("✓ Added hello route")
-
-        # Update .env
-        env_path = os.path.join(project_path, '.env')
-        if os.path.exists(env_path):
-            with open(env_path, 'w') as f:
-                f.write(LaravelModel.get_env())
-            click.echo("✓ Updated .env")
+        # Octane keeps the framework booted between requests
+        skeleton_commands = []
+        if perf:
+            skeleton_commands = [
+                ['composer', 'require', *(f'{package}:{constraint}'
+                                          for package, constraint in LaravelModel.get_perf_packages().items())],
+                ['php', 'artisan', 'octane:install', '--server=roadrunner', '--no-interaction'],
+            ]
+
+        # `composer create-project` only runs on a cache miss; later projects copy the
+        # cached skeleton and hardlink its vendor packages
+        state.begin()
+        if not state.is_done('skeleton'):
+            click.echo("\n📦 Creating Laravel project...")
+            skeleton = get_laravel_skeleton(LARAVEL_VERSION, php_minor, skeleton_commands)
+            if skeleton is None:
+                click.echo(f"📦 Rendering Laravel {LARAVEL_VERSION} skeleton (cached for future projects)...")
+                skeleton = build_laravel_skeleton(LARAVEL_VERSION, php_minor, skeleton_commands)
+            else:
+                click.echo(f"✓ Using cached Laravel {LARAVEL_VERSION} skeleton")
+            state.clean()
+            materialize_laravel_skeleton(skeleton, project_path)
+            state.done('skeleton')
         else:
-            click.echo("✓ Using default .env")
+            click.echo(f"✓ Laravel {LARAVEL_VERSION} skeleton already in place")
+
+        if not state.is_done('files'):
+            if perf:
+                click.echo("✓ Installed Octane (RoadRunner)")
+                perf_files = {
+                    os.path.join('php', 'opcache.ini'): LaravelModel.get_opcache_ini(),
+                    'preload.php': LaravelModel.get_preload_php(),
+                    'Makefile': LaravelModel.get_makefile(),
+                }
+                write_files(project_path, perf_files)
+                click.echo("✓ Created php/opcache.ini, preload.php and Makefile")
+
+            # Create HelloController
+            controller_path = os.path.join(project_path, 'app', 'Http', 'Controllers', 'HelloController.php')
+            os.makedirs(os.path.dirname(controller_path), exist_ok=True)
+            with open(controller_path, 'w') as f:
+                f.write(LaravelModel.get_hello_controller())
+            click.echo("✓ Created HelloController")
+
+            # Create HelloController test
+            test_path = os.path.join(project_path, 'tests', 'Feature', 'HelloControllerTest.php')
+            os.makedirs(os.path.dirname(test_path), exist_ok=True)
+            with open(test_path, 'w') as f:
+                f.write(LaravelModel.get_hello_test())
+            click.echo("✓ Created HelloController test")
+
+            # Add hello route to web.php (once, even if this step is re-run)
+            routes_path = os.path.join(project_path, 'routes', 'web.php')
+            hello_route = "Route::get('/hello', [App\\Http\\Controllers\\HelloController::class, 'index']);"
+            with open(routes_path) as f:
+                has_route = hello_route in f.read()
+            if not has_route:
+                with open(routes_path, 'a') as f:
+                    f.write("\n" + hello_route)
+            click.echo("✓ Added hello route")
+
+            # Create .env (the skeleton ships without one so every app gets its own key)
+            env_path = os.path.join(project_path, '.env')
+            with open(env_path, 'w') as f:
+                f.write(LaravelModel.get_env(perf, name))
+            click.echo("✓ Created .env")
 
-        # Update README.md
-        readme_path = os.path.join(project_path, 'README.md')
-        with open(readme_path, 'w') as f:
-            f.write(LaravelModel.get_readme(name))
-        click.echo("✓ Updated README.md")
+            # Update README.md
+            readme_path = os.path.join(project_path, 'README.md')
+            with open(readme_path, 'w') as f:
+                f.write(LaravelModel.get_readme(name, perf))
+            click.echo("✓ Updated README.md")
+            state.done('files')
 
         # Run post-install commands
-        click.echo("\n📦 Running post-install commands...")
-        subprocess.run(['php', 'artisan', 'key:generate'], cwd=project_path, check=True)
-        
+        if not state.is_done('key'):
+            click.echo("\n📦 Running post-install commands...")
+            subprocess.run(['php', 'artisan', 'key:generate'], cwd=project_path, check=True)
+            state.done('key')
+        state.finish()
+
         click.echo("\n✨ Laravel project created successfully!")
         click.echo("\nNext steps:")
         click.echo(command_text(f"cd {name}"))
-        click.echo(command_text("php artisan serve  # Start development server"))
+        if perf:
+            click.echo(command_text("brew install redis && brew services start redis  # Cache, sessions and queues"))
+            click.echo(command_text("pecl install redis  # phpredis extension"))
+            click.echo(command_text("make serve  # Cache config/routes/views and start Octane"))
+        else:
+            click.echo(command_text("php artisan serve  # Start development server"))
         click.echo(command_text("aske init  # Initialize git repository"))
         click.echo("\nThen visit: http://localhost:8000/hello")
 
@@ -1241,6 +1486,7 @@ def php(name):
 
     except subprocess.CalledProcessError as e:
         click.echo(error_text(f"\n❌ Error creating Laravel project: {e}"), err=True)
+        echo_resume_hint(name)
         return
     except Exception as e:
         click.echo(error_text(f"\n❌ Unexpected error: {e}"), err=True)
@@ -1250,7 +1496,8 @@ def php(name):
 @click.argument('name')
 @click.option('--framework', type=click.Choice(['pure', 'gin', 'echo', 'fiber', 'chi', 'buffalo', 'revel']), 
               help='Choose a Go web framework', default='gin')
-def go(name, framework):
+@click.option('--resume', is_flag=True, hidden=True)
+def go(name, framework, resume):
     """Create a new Go project and set up its structure"""
     project_path = os.path.abspath(name)
     
@@ -1268,71 +1515,41 @@ def go(name, framework):
         return
 
     # Import the appropriate model based on framework choice
-    if framework == 'pure':
-        from aske.core.models.go import GoModel
-        model_class = GoModel
-    else:
-        try:
-            module = importlib.import_module(f'aske.core.models.go.{framework}')
-            model_class = getattr(module, f'{framework.title()}Model')
-        except (ImportError, AttributeError):
-            click.echo(error_text(f"\n❌ Framework {framework} not yet supported"))
-            click.echo("Falling back to Gin framework")
-            from aske.core.models.go.gin import GinModel
-            model_class = GinModel
-
-    # Check if project already exists
-    if os.path.exists(project_path):
-        click.echo(error_text(f"❌ Error: Project directory '{name}' already exists"), err=True)
-        click.echo(error_text("Please choose a different name or remove the existing directory"), err=True)
-        sys.exit(1)
+    model_class = get_go_model(framework)
+    if model_class is None:
+        click.echo(error_text(f"\n❌ Framework {framework} not yet supported"))
+        click.echo("Falling back to Gin framework")
+        model_class = GoBaseModel
+
+    state = start_generation('go', name, resume, {'framework': framework})
 
     # Create project directory and structure
     click.echo(f"\n📁 Creating project directory: {project_path}")
-    os.makedirs(project_path, exist_ok=False)
+    state.begin()
     
     # Create Go project structure
-    model_class.create_project_structure(project_path)
-    click.echo("✓ Created project structure")
-
-    # Create project files
-    if framework == 'revel':
-        files = {
-            'go.mod': model_class.get_mod_file(name),
-            'app/controllers/app.go': model_class.get_app_controller(),
-            'conf/app.conf': model_class.get_app_conf(),
-            'conf/routes': model_class.get_routes(),
-            'main.go': model_class.get_main_file(),  # Add main.go in root
-            '.env': model_class.get_env(),
-            '.gitignore': model_class.get_gitignore(),
-            'README.md': model_class.get_readme(name),
-        }
-    else:
-        files = {
-            'go.mod': model_class.get_mod_file(name),
-            'cmd/main/main.go': model_class.get_main_file(),
-            '.env': model_class.get_env(),
-            '.gitignore': model_class.get_gitignore(),
-            'README.md': model_class.get_readme(name),
-            'Makefile': model_class.get_makefile()
-        }
-
-    for file_path, content in files.items():
-        full_path = os.path.join(project_path, file_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        click.echo(f"📄 Creating {file_path}")
-        with open(full_path, 'w') as f:
-            f.write(content)
+    if not state.is_done('files'):
+        # Name-independent files come from the generation cache
+        echo_generated(generate('go', name, project_path, {'framework': framework}))
+        state.done('files')
 
     # Initialize go modules and download dependencies
     click.echo("\n📦 Installing dependencies...")
+    engine = Engine()
+    if not state.is_done('tidy'):
+        engine.add('tidy', command=['go', 'mod', 'tidy'], cwd=project_path, timeout=600)
+        engine.add('checkpoint', func=lambda: state.done('tidy'), after='tidy')
+    engine.add('download', command=['go', 'mod', 'download'], after=[*engine.steps], cwd=project_path, timeout=600)
     try:
-        # Initialize and download modules
-        subprocess.run(['go', 'mod', 'tidy'], cwd=project_path, check=True)
-        subprocess.run(['go', 'mod', 'download'], cwd=project_path, check=True)
+        engine.run()
+        state.done('download')
+        state.finish()
         click.echo("✓ Dependencies installed")
-    except subprocess.CalledProcessError as e:
-        click.echo(error_text(f"\n❌ Error installing dependencies"))
+    except StepError as e:
+        click.echo(error_text(f"\n❌ Error installing dependencies ({e})"))
+        if e.output:
+            click.echo(e.output.strip())
+        echo_resume_hint(name)
         click.echo("\nTry running these commands manually:")
         click.echo(command_text("go mod tidy"))
         click.echo(command_text("go mod download"))
@@ -1360,6 +1577,7 @@ def go(name, framework):
         click.echo(command_text("go install github.com/revel/cmd/revel@latest  # Install Revel CLI"))
         click.echo(command_text("go mod tidy        # Clean up dependencies"))
         click.echo(command_text("revel run          # Run the Revel application"))
+        click.echo(command_text("make image         # Build the production container image"))
         click.echo(command_text("aske init          # Initialize git repository"))
         click.echo("\nThen visit: http://localhost:9000")
     else:
@@ -1369,6 +1587,9 @@ def go(name, framework):
         click.echo(command_text("go run cmd/main/main.go  # Run the application"))
         click.echo(command_text("make test          # Run tests"))
         click.echo(command_text("make build         # Build the application"))
+        click.echo(command_text("make build-release # Build a static, stripped release binary"))
+        click.echo(command_text("make image         # Build the production container image"))
+        click.echo(command_text("make pgo           # Profile under load and rebuild with PGO"))
         click.echo(command_text("golangci-lint run  # Check code quality"))
         click.echo(command_text("aske init          # Initialize git repository"))
 
@@ -1381,5 +1602,332 @@ def go(name, framework):
         click.echo(command_text("go get github.com/gofiber/fiber/v2"))
     click.echo(command_text("go get github.com/joho/godotenv"))
 
+@main.command()
+@click.option('--port', type=int, help="Port to serve on; defaults to the project's PORT")
+def dev(port):
+    """Run the project and rebuild it on every change"""
+    project_path = os.getcwd()
+    target = detect_target(project_path)
+    if target is None:
+        click.echo(error_text("❌ Error: Could not tell which kind of project this is"), err=True)
+        click.echo(error_text("Run aske dev in a directory created with 'aske <framework> <name>'"), err=True)
+        sys.exit(1)
+    port = port or target.port
+
+    click.echo(f"\n🚀 Starting {target.kind} dev server on http://localhost:{port}")
+    click.echo("=" * 50)
+
+    def report(message, level='info'):
+        if level == 'error':
+            click.echo(error_text(message), err=True)
+        elif level == 'success':
+            click.echo(success_text(message))
+        else:
+            click.echo(message)
+
+    try:
+        DevRunner(target, project_path, port, report).run()
+    except KeyboardInterrupt:
+        click.echo("\n👋 Dev server stopped")
+    except OSError as e:
+        click.echo(error_text(f"❌ Error running dev server: {e}"), err=True)
+        sys.exit(1)
+
+@main.command()
+@click.argument('directory', type=click.Path(exists=True, file_okay=False))
+@click.pass_context
+def resume(ctx, directory):
+    """Continue an interrupted project generation"""
+    try:
+        state = GenerationState.load(os.path.abspath(directory))
+    except ValueError as e:
+        click.echo(error_text(f"❌ Error: {e}"), err=True)
+        sys.exit(1)
+    if state is None:
+        click.echo(error_text(f"❌ Error: '{directory}' has no record of an aske generation"), err=True)
+        sys.exit(1)
+    if state.finished:
+        click.echo(success_text(f"✓ '{directory}' was already generated completely"))
+        return
+
+    cwd = state.get_resume_cwd()
+    if cwd is None:
+        click.echo(error_text(f"❌ Error: '{directory}' was renamed from '{state.name}'; rename it back to resume"), err=True)
+        sys.exit(1)
+    command = ctx.parent.command.get_command(ctx.parent, state.command)
+    if command is None:
+        click.echo(error_text(f"❌ Error: Unknown generator '{state.command}'"), err=True)
+        sys.exit(1)
+
+    click.echo(f"🔁 Resuming aske {state.command} {state.name} after: {', '.join(state.completed) or 'nothing'}")
+    if not change_directory(cwd):
+        sys.exit(1)
+    ctx.invoke(command, name=state.name, resume=True, **state.options)
+
+@main.group()
+def cache():
+    """Manage shared dependency caches"""
+    pass
+
+@cache.command()
+@click.argument('stack', type=click.Choice(['java', 'node', 'express', 'next']))
+@click.option('--perf', is_flag=True, help='Warm the --perf dependency set (java, next)')
+@click.option('--datasource', type=click.Choice(['postgresql', 'mysql']),
+              help='Include the JDBC driver for this datasource (java)')
+def warm(stack, perf, datasource):
+    """Pre-seed the shared cache for a stack"""
+    if stack == 'java':
+        warm_java_cache(perf, datasource)
+    else:
+        warm_yarn_cache(stack, perf)
+
+def warm_java_cache(perf, datasource):
+    """Resolve a Spring project's full dependency graph into the shared repository"""
+    click.echo("\n☕ Warming Java dependency cache")
+    click.echo("=" * 50)
+
+    files = SpringModel.get_project_files(CACHE_SEED, perf=perf, datasource=datasource)
+    pom = files['pom.xml']
+    if is_maven_warm(pom):
+        click.echo(success_text("✓ Java dependency cache is already warm"))
+        return
+
+    if get_maven_wrapper_template() is None and not shutil.which('mvn'):
+        click.echo(error_text("\n❌ Maven is not installed!"))
+        click.echo("\nPlease install Maven first:")
+        click.echo(command_text("brew install maven"))
+        return
+
+    # Build a throwaway project identical to what `aske java` generates
+    seed_path = os.path.join(get_cache_dir('maven', 'seed'), cache_key(pom))
+    shutil.rmtree(seed_path, ignore_errors=True)
+    write_files(seed_path, files)
+
+    try:
+        click.echo("\n📦 Preparing Maven wrapper template...")
+        install_maven_wrapper(seed_path)
+        use_maven_repository(seed_path)
+        click.echo("✓ Maven wrapper template cached")
+
+        # go-offline fetches plugins and dependencies; verify also pulls in test providers
+        click.echo("\n📦 Resolving dependencies...")
+        command = ['./mvnw', '-B', 'dependency:go-offline', 'clean', 'verify']
+        if perf:
+            command.insert(2, '-Pnative-ready')
+        subprocess.run(command, cwd=seed_path, check=True)
+        mark_maven_warm(pom)
+    except (subprocess.CalledProcessError, OSError) as e:
+        click.echo(error_text(f"\n❌ Error warming Java cache: {e}"), err=True)
+        return
+    finally:
+        shutil.rmtree(seed_path, ignore_errors=True)
+
+    click.echo(success_text("\n✨ Java dependency cache is warm!"))
+    click.echo("\nNew projects build offline right after scaffolding:")
+    click.echo(command_text("./mvnw -o clean install"))
+
+def warm_yarn_cache(stack, perf):
+    """Fill the yarn offline mirror and lockfile cache for a Node template"""
+    click.echo(f"\n📦 Warming {stack} dependency cache")
+    click.echo("=" * 50)
+
+    package_json = {
+        'node': lambda: NodejsModel.get_package_json(CACHE_SEED),
+        'express': lambda: ExpressModel.get_package_json(CACHE_SEED),
+        'next': lambda: NextjsModel.get_package_json(CACHE_SEED, perf),
+    }[stack]()
+    if is_yarn_warm(package_json):
+        click.echo(success_text(f"✓ {stack} dependency cache is already warm"))
+        return
+
+    # Install the template's package.json once; the tarballs land in the mirror
+    seed_path = os.path.join(get_cache_dir('yarn', 'seed'), cache_key(package_json))
+    shutil.rmtree(seed_path, ignore_errors=True)
+    write_files(seed_path, {'package.json': package_json})
+    use_yarn_offline_mirror(seed_path)
+
+    try:
+        click.echo("\n📦 Resolving dependencies...")
+        yarn_install(seed_path, package_json)
+    except (subprocess.CalledProcessError, OSError) as e:
+        click.echo(error_text(f"\n❌ Error warming {stack} cache: {e}"), err=True)
+        return
+    finally:
+        shutil.rmtree(seed_path, ignore_errors=True)
+
+    click.echo(success_text(f"\n✨ {stack} dependency cache is warm!"))
+    click.echo("\nNew projects install offline during scaffolding:")
+    click.echo(command_text(f"aske {stack} project-name --install"))
+
+@main.group()
+def platform():
+    """Scaffold a multi-component platform"""
+    pass
+
+def get_component_command(name, component):
+    """Build the aske argv that scaffolds a platform component
+
+    Properties other than type, depends_on and solution become options:
+    `framework: gin` -> --framework gin, `perf: true` -> --perf.
+    """
+    component_type = component['type']
+    if component_type == 'sol':
+        command = ['sol', component.get('solution', 'postgresql'), name]
+    else:
+        command = [component_type, name]
+        if component_type == 'ruby':
+            command.append('--yes')
+
+    for key, value in component.items():
+        if key in ('type', 'depends_on', 'solution') or value is False or value is None:
+            continue
+        option = '--' + key.replace('_', '-')
+        command += [option] if value is True else [option, str(value)]
+    return command
+
+def run_platform_component(name, command, root, log_path):
+    """Run one component's generator in its own aske process, logging its output"""
+    started = time.monotonic()
+    with open(log_path, 'w') as log:
+        result = subprocess.run([sys.executable, '-m', 'aske.cli'] + command, cwd=root,
+                                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode, time.monotonic() - started
+
+@platform.command()
+@click.argument('spec', type=click.Path(exists=True, dir_okay=False))
+@click.option('--jobs', '-j', default=4, show_default=True, help='Components scaffolded at once')
+def up(spec, jobs):
+    """Scaffold every component of a platform.yaml in dependency order"""
+    root = os.path.dirname(os.path.abspath(spec))
+    try:
+        with open(spec) as f:
+            platform_spec = Platform.from_dict(yaml.safe_load(f))
+    except (yaml.YAMLError, ValueError) as e:
+        click.echo(error_text(f"❌ Invalid platform definition: {e}"), err=True)
+        sys.exit(1)
+
+    for name in platform_spec.list_components():
+        component_type = platform_spec.get_component(name)['type']
+        if component_type not in PLATFORM_GENERATORS:
+            click.echo(error_text(f"❌ Component '{name}' has unknown type '{component_type}'"), err=True)
+            click.echo(f"Available types: {', '.join(PLATFORM_GENERATORS)}")
+            sys.exit(1)
+
+    click.echo(f"\n🏗️  Bringing up platform: {platform_spec.name}")
+    click.echo("=" * 50)
+
+    # Scaffolding never needs a database to be running, so dependencies on sol
+    # components only order runtime start-up; their VMs boot alongside the code generators
+    blocking = {
+        name: [dependency for dependency in platform_spec.get_dependencies(name)
+               if platform_spec.get_component(dependency)['type'] != 'sol']
+        for name in platform_spec.list_components()
+    }
+    log_dir = os.path.join(root, '.aske', 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+
+    pending = platform_spec.topological_order()
+    running, done, failed, skipped = {}, set(), set(), set()
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name in [*pending]:
+                dependencies = set(blocking[name])
+                if dependencies & (failed | skipped):
+                    pending.remove(name)
+                    skipped.add(name)
+                    click.echo(error_text(f"⏭️  Skipped {name} (a dependency failed)"))
+                    continue
+                if not dependencies <= done:
+                    continue
+                pending.remove(name)
+                component = platform_spec.get_component(name)
+                command = get_component_command(name, component)
+                click.echo(f"▶️  {name}: aske {' '.join(command)}")
+                future = pool.submit(run_platform_component, name, command, root,
+                                     os.path.join(log_dir, f'{name}.log'))
+                running[future] = name
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                component = platform_spec.get_component(name)
+                try:
+                    returncode, duration = future.result()
+                except OSError as e:
+                    returncode, duration = 1, 0
+                    click.echo(error_text(f"❌ {name}: {e}"), err=True)
+                # Generators report some failures without a non-zero exit; check their output exists
+                output = (os.path.expanduser(f"~/.lima/{name}.yaml") if component['type'] == 'sol'
+                          else os.path.join(root, name))
+                if returncode == 0 and os.path.exists(output):
+                    done.add(name)
+                    click.echo(success_text(f"✓ {name} ({duration:.1f}s)"))
+                else:
+                    failed.add(name)
+                    log_path = os.path.relpath(os.path.join(log_dir, f'{name}.log'))
+                    click.echo(error_text(f"❌ {name} failed, see {log_path}"), err=True)
+
+    click.echo(f"\n⏱️  {len(done)} of {len(platform_spec.components)} components ready "
+               f"in {time.monotonic() - started:.1f}s")
+    if failed or skipped:
+        sys.exit(1)
+    click.echo(success_text("✨ Platform is up!"))
+
+@main.group()
+def daemon():
+    """Keep aske warm in the background for aske-client"""
+    pass
+
+@daemon.command('start')
+@click.option('--detach', is_flag=True, help='Run in the background')
+def daemon_start(detach):
+    """Start the aske daemon"""
+    socket_path = get_socket_path()
+    if is_running(socket_path):
+        click.echo(success_text(f"✓ aske daemon is already running (pid {get_pid(socket_path)})"))
+        return
+
+    if detach:
+        log_path = os.path.join(os.path.dirname(socket_path), 'daemon.log')
+        os.makedirs(os.path.dirname(socket_path), mode=0o700, exist_ok=True)
+        with open(log_path, 'a') as log:
+            subprocess.Popen([sys.executable, '-m', 'aske.cli', 'daemon', 'start'],
+                             stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                             start_new_session=True)
+        for _ in range(50):
+            if is_running(socket_path):
+                click.echo(success_text(f"✓ aske daemon started (pid {get_pid(socket_path)})"))
+                click.echo("\nRun commands through it with:")
+                click.echo(command_text("aske-client <command>"))
+                return
+            time.sleep(0.1)
+        click.echo(error_text(f"❌ aske daemon did not start, see {log_path}"), err=True)
+        sys.exit(1)
+
+    click.echo(f"🚀 aske daemon listening on {socket_path} (Ctrl-C to stop)")
+    serve(main, socket_path)
+
+@daemon.command('stop')
+def daemon_stop():
+    """Stop the aske daemon"""
+    pid = get_pid()
+    if pid is None or not is_running():
+        click.echo("aske daemon is not running")
+        return
+    os.kill(pid, signal.SIGTERM)
+    click.echo(success_text(f"✓ Stopped aske daemon (pid {pid})"))
+
+@daemon.command('status')
+def daemon_status():
+    """Show whether the aske daemon is running"""
+    if is_running():
+        click.echo(success_text(f"✓ aske daemon is running (pid {get_pid()}) on {get_socket_path()}"))
+    else:
+        click.echo("aske daemon is not running")
+        sys.exit(1)
+
 if __name__ == '__main__':
     main()
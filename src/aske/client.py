@@ -0,0 +1,102 @@
+"""Thin aske client that forwards a command to a running `aske daemon`
+
+Only the standard library is imported here so the client starts in a few
+milliseconds. Without a daemon (or with one from another aske version) the
+command runs in-process exactly as `aske` would.
+"""
+import json
+import os
+import socket
+import struct
+import sys
+
+from aske import __version__
+
+# Length prefix of every message on the daemon socket
+HEADER = struct.Struct('!I')
+
+
+def get_socket_path():
+    """Get the daemon socket path (override with ASKE_DAEMON_SOCKET)"""
+    return os.environ.get('ASKE_DAEMON_SOCKET') or os.path.join(os.path.expanduser('~'), '.aske', 'daemon.sock')
+
+
+def send_message(sock, message, fds=()):
+    """Send a length-prefixed JSON message, optionally passing file descriptors"""
+    payload = json.dumps(message).encode('utf-8')
+    data = HEADER.pack(len(payload)) + payload
+    if fds:
+        sent = socket.send_fds(sock, [data], list(fds))
+        data = data[sent:]
+    if data:
+        sock.sendall(data)
+
+
+def recv_message(sock, maxfds=0):
+    """Receive a length-prefixed JSON message; returns (message, fds)"""
+    if maxfds:
+        data, fds, _, _ = socket.recv_fds(sock, 65536, maxfds)
+    else:
+        data, fds = sock.recv(65536), []
+    if not data:
+        raise ConnectionError("connection closed")
+    while len(data) < HEADER.size:
+        data += _recv_some(sock)
+    (length,) = HEADER.unpack_from(data)
+    while len(data) < HEADER.size + length:
+        data += _recv_some(sock)
+    return json.loads(data[HEADER.size:HEADER.size + length]), fds
+
+
+def _recv_some(sock):
+    chunk = sock.recv(65536)
+    if not chunk:
+        raise ConnectionError("connection closed mid-message")
+    return chunk
+
+
+def forward(argv):
+    """Run argv on the daemon with this process's stdio; returns the exit code or None"""
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(get_socket_path())
+    except OSError:
+        return None
+
+    with sock:
+        try:
+            send_message(sock, {
+                'version': __version__,
+                'argv': argv,
+                'env': dict(os.environ),
+                'cwd': os.getcwd(),
+            }, fds=[0, 1, 2])
+        except OSError:
+            return None
+        try:
+            reply, _ = recv_message(sock)
+        except KeyboardInterrupt:
+            # Closing the connection interrupts the command on the daemon side
+            return 130
+        except (OSError, ConnectionError) as e:
+            # The command may have started, so never run it a second time
+            sys.stderr.write(f"aske: lost connection to the daemon: {e}\n")
+            return 1
+    if 'exit' not in reply:
+        # e.g. a daemon left running from another aske version
+        return None
+    return reply['exit']
+
+
+def main():
+    """Entry point of aske-client"""
+    code = forward(sys.argv[1:])
+    if code is None:
+        from aske.cli import main as cli_main
+        cli_main(args=sys.argv[1:], prog_name='aske')
+        return
+    sys.exit(code)
+
+
+if __name__ == '__main__':
+    main()
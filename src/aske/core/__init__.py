@@ -6,6 +6,24 @@ class Platform:
         self.name = name
         self.components = {}
 
+    @classmethod
+    def from_dict(cls, data):
+        """Build a platform from a parsed platform.yaml
+
+        Expects {'name': ..., 'components': {component: {properties}}}; each
+        component may list the components it needs in 'depends_on'.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get('components'), dict):
+            raise ValueError("Platform definition needs a 'components' mapping")
+
+        platform = cls(data.get('name', 'platform'))
+        for name, properties in data['components'].items():
+            if not isinstance(properties, dict) or 'type' not in properties:
+                raise ValueError(f"Component '{name}' needs a 'type'")
+            platform.add_component(name, **properties)
+        platform.topological_order()
+        return platform
+
     def add_component(self, name, **properties):
         """Add a component to the platform"""
         self.components[name] = properties
@@ -18,3 +36,35 @@ class Platform:
     def list_components(self):
         """List all components"""
         return list(self.components.keys())
+
+    def get_dependencies(self, name):
+        """Get the names of the components a component depends on"""
+        depends_on = self.components[name].get('depends_on') or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        return list(depends_on)
+
+    def topological_order(self):
+        """List components so that every component follows its dependencies
+
+        Raises ValueError on unknown dependencies or dependency cycles.
+        """
+        order, state = [], {}
+
+        def visit(name, path):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                cycle = path[path.index(name):] + [name]
+                raise ValueError(f"Dependency cycle: {' -> '.join(cycle)}")
+            state[name] = 'visiting'
+            for dependency in self.get_dependencies(name):
+                if dependency not in self.components:
+                    raise ValueError(f"Component '{name}' depends on unknown component '{dependency}'")
+                visit(dependency, path + [name])
+            state[name] = 'done'
+            order.append(name)
+
+        for name in self.components:
+            visit(name, [])
+        return order
@@ -0,0 +1,609 @@
+"""Shared caches reused across generated projects"""
+import hashlib
+import json
+import os
+import re
+import secrets
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from aske import __version__
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Files produced by `mvn -N wrapper:wrapper`, relative to the project root
+MAVEN_WRAPPER_FILES = [
+    'mvnw',
+    'mvnw.cmd',
+    os.path.join('.mvn', 'wrapper', 'maven-wrapper.properties'),
+]
+
+
+def get_cache_root():
+    """Get the root of the aske cache (override with ASKE_CACHE_DIR)"""
+    return os.environ.get('ASKE_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.aske', 'cache')
+
+
+def get_cache_dir(*parts):
+    """Get a directory inside the aske cache, creating it if needed"""
+    path = os.path.join(get_cache_root(), *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_key(*values):
+    """Build a short, stable key from the values that define a cache entry"""
+    digest = hashlib.sha256('\0'.join(str(value) for value in values).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+# How static files are materialized, chosen with ASKE_LINK_MODE: 'copy' copies
+# inside the kernel; the opt-in 'reflink' shares blocks copy-on-write and
+# 'hardlink' shares the file itself, so an in-place edit of the project file
+# also changes the cached or packaged original
+LINK_MODES = ['copy', 'reflink', 'hardlink']
+
+# Linux ioctl that makes a file share another file's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+def get_link_mode():
+    """Get the materialization mode for static files (ASKE_LINK_MODE, default copy)"""
+    mode = os.environ.get('ASKE_LINK_MODE', 'copy')
+    return mode if mode in LINK_MODES else 'copy'
+
+
+def _copy_fds(copy, src, dst):
+    """Copy an open file with copy(src, dst, count) -> copied until EOF"""
+    os.lseek(src, 0, os.SEEK_SET)
+    os.lseek(dst, 0, os.SEEK_SET)
+    os.ftruncate(dst, 0)
+    while copy(src, dst, 1 << 30):
+        pass
+
+
+def copy_file(source, target):
+    """Copy source to target without reading the data into Python
+
+    Uses copy_file_range (which may share blocks on btrfs/XFS/NFS), then
+    sendfile, then shutil.copyfile (fcopyfile on macOS).
+    """
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        for copy in (getattr(os, 'copy_file_range', None),
+                     lambda s, d, count: os.sendfile(d, s, None, count)):
+            if copy is None:
+                continue
+            try:
+                _copy_fds(copy, src.fileno(), dst.fileno())
+                return
+            except OSError:
+                # e.g. EXDEV on older kernels, or macOS sendfile (sockets only)
+                continue
+    shutil.copyfile(source, target)
+
+
+def clone_file(source, target, mode=None):
+    """Materialize source at target in the given (or configured) link mode
+
+    Unsupported links fall back to reflink, then copy. Returns the mode used.
+    """
+    mode = mode or get_link_mode()
+    if mode == 'hardlink':
+        if os.path.lexists(target):
+            os.remove(target)
+        try:
+            os.link(source, target)
+            return 'hardlink'
+        except OSError:
+            pass
+    if mode in ('reflink', 'hardlink') and fcntl is not None and sys.platform.startswith('linux'):
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return 'reflink'
+        except OSError:
+            pass
+    copy_file(source, target)
+    return 'copy'
+
+
+def write_file(full_path, content):
+    """Write one generated file; static templates are copied from the pack"""
+    if getattr(content, 'path', None):
+        clone_file(content.path, full_path)
+        return
+    with open(full_path, 'w') as f:
+        f.write(content)
+
+
+def write_files(root, files):
+    """Write a {relative path: content} mapping under root"""
+    for file_path, content in files.items():
+        full_path = os.path.join(root, file_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        write_file(full_path, content)
+
+
+def make_staging_dir(path):
+    """Create a private directory next to path to render a cache entry in"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return tempfile.mkdtemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=os.path.dirname(path))
+
+
+def publish_dir(rendered, path):
+    """Move a fully rendered cache entry into place
+
+    When another process published the same entry first, theirs is kept.
+    """
+    try:
+        os.rename(rendered, path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+
+
+def materialize_tree(src, dest, replacements=None, link_dirs=(), copy_paths=()):
+    """Copy a cached tree to dest, substituting placeholders in text files
+
+    Files without any placeholder are copied as-is (metadata included); the
+    rest are rewritten with every key of replacements replaced by its value.
+    Files under the top-level directories named in link_dirs are hardlinked
+    from src instead, falling back to copies across filesystems, except those
+    at or under the relative paths in copy_paths, which are always copied.
+    """
+    replacements = {k.encode('utf-8'): v.encode('utf-8') for k, v in (replacements or {}).items()}
+    copied = [os.path.normpath(path) for path in copy_paths]
+    can_link = bool(link_dirs)
+    for current, dirs, files in os.walk(src):
+        relative = os.path.relpath(current, src)
+        target_dir = os.path.normpath(os.path.join(dest, relative))
+        os.makedirs(target_dir, exist_ok=True)
+        linked = relative.split(os.sep)[0] in link_dirs
+        for dir_name in [d for d in dirs if os.path.islink(os.path.join(current, d))]:
+            os.symlink(os.readlink(os.path.join(current, dir_name)), os.path.join(target_dir, dir_name))
+            dirs.remove(dir_name)
+        for file_name in files:
+            source = os.path.join(current, file_name)
+            target = os.path.join(target_dir, file_name)
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), target)
+                continue
+            path = os.path.normpath(os.path.join(relative, file_name))
+            if linked and can_link and not any(path == c or path.startswith(c + os.sep) for c in copied):
+                try:
+                    os.link(source, target)
+                    continue
+                except OSError:
+                    # Different filesystem or no hardlink support: copy from now on
+                    can_link = False
+            if linked:
+                shutil.copy2(source, target)
+                continue
+            with open(source, 'rb') as f:
+                content = f.read()
+            if any(key in content for key in replacements):
+                for key, value in replacements.items():
+                    content = content.replace(key, value)
+                with open(target, 'wb') as f:
+                    f.write(content)
+                shutil.copymode(source, target)
+            else:
+                shutil.copy2(source, target)
+
+
+# Maven
+
+def get_maven_repository():
+    """Get the local Maven repository shared by all aske Java projects"""
+    return get_cache_dir('maven', 'repository')
+
+
+def get_maven_wrapper_template():
+    """Get the cached Maven wrapper directory, or None if not cached yet"""
+    template = os.path.join(get_cache_root(), 'maven', 'wrapper')
+    if all(os.path.exists(os.path.join(template, f)) for f in MAVEN_WRAPPER_FILES):
+        return template
+    return None
+
+
+def save_maven_wrapper_template(project_path):
+    """Store the wrapper files of a project as the cached template"""
+    template = get_cache_dir('maven', 'wrapper')
+    for file_path in MAVEN_WRAPPER_FILES:
+        target = os.path.join(template, file_path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copy2(os.path.join(project_path, file_path), target)
+    return template
+
+
+def install_maven_wrapper(project_path):
+    """Copy the Maven wrapper into a project, generating the template on first use
+
+    Returns True when the wrapper came from the cache.
+    """
+    template = get_maven_wrapper_template()
+    if template is None:
+        subprocess.run(['mvn', '-N', 'wrapper:wrapper'], cwd=project_path, check=True)
+        save_maven_wrapper_template(project_path)
+        return False
+
+    for file_path in MAVEN_WRAPPER_FILES:
+        target = os.path.join(project_path, file_path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copy2(os.path.join(template, file_path), target)
+    return True
+
+
+def use_maven_repository(project_path):
+    """Point a project's Maven builds at the shared repository via .mvn/maven.config"""
+    config_path = os.path.join(project_path, '.mvn', 'maven.config')
+    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+    with open(config_path, 'w') as f:
+        f.write(f'-Dmaven.repo.local={get_maven_repository()}\n')
+
+
+def get_maven_warm_marker(pom):
+    """Path of the marker recording that a pom's dependencies are cached"""
+    return os.path.join(get_cache_root(), 'maven', 'warm', cache_key(pom))
+
+
+def is_maven_warm(pom):
+    """Check whether everything a pom needs is in the shared repository"""
+    return os.path.exists(get_maven_warm_marker(pom))
+
+
+def mark_maven_warm(pom):
+    """Record that a pom's dependencies are in the shared repository"""
+    marker = get_maven_warm_marker(pom)
+    os.makedirs(os.path.dirname(marker), exist_ok=True)
+    with open(marker, 'w') as f:
+        f.write(pom)
+
+
+# Rails
+
+# App name the cached skeleton is rendered with; replaced on materialization
+RAILS_SKELETON_NAME = 'aske_skeleton_app'
+
+# Per-app secrets that must never be shared between projects; every app gets a
+# new master key and credentials encrypted with it (see create_rails_credentials)
+RAILS_SKELETON_SECRETS = [
+    os.path.join('config', 'master.key'),
+    os.path.join('config', 'credentials.yml.enc'),
+]
+
+
+def get_rails_names(name):
+    """Get the (snake_case, CamelCase) names Rails derives from an app name"""
+    snake = re.sub(r'_+', '_', re.sub(r'\W', '_', name))
+    camel = ''.join(part[:1].upper() + part[1:] for part in snake.split('_') if part)
+    return snake, camel
+
+
+def get_rails_skeleton_dir(rails_options, ruby_version):
+    """Get the cache directory for a skeleton rendered with the given options"""
+    return os.path.join(get_cache_root(), 'rails', cache_key(ruby_version, *rails_options))
+
+
+def get_rails_skeleton(rails_options, ruby_version):
+    """Get the cached skeleton for these options, or None on a cache miss"""
+    skeleton = get_rails_skeleton_dir(rails_options, ruby_version)
+    return skeleton if os.path.isdir(skeleton) else None
+
+
+def build_rails_skeleton(rails_options, ruby_version, env=None):
+    """Run `rails new` once for these options and store the result in the cache"""
+    skeleton = get_rails_skeleton_dir(rails_options, ruby_version)
+    staging = make_staging_dir(skeleton)
+    try:
+        subprocess.run(['rails', 'new', RAILS_SKELETON_NAME] + list(rails_options),
+                       cwd=staging, check=True, env=env)
+        rendered = os.path.join(staging, RAILS_SKELETON_NAME)
+        for secret in RAILS_SKELETON_SECRETS:
+            secret_path = os.path.join(rendered, secret)
+            if os.path.exists(secret_path):
+                os.remove(secret_path)
+        publish_dir(rendered, skeleton)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return skeleton
+
+
+def materialize_rails_skeleton(skeleton, project_path, name):
+    """Create a Rails app from a cached skeleton with its own name and master key"""
+    skeleton_snake, skeleton_camel = get_rails_names(RAILS_SKELETON_NAME)
+    snake, camel = get_rails_names(name)
+    materialize_tree(skeleton, project_path, {skeleton_camel: camel, skeleton_snake: snake})
+
+    master_key = os.path.join(project_path, 'config', 'master.key')
+    with open(master_key, 'w') as f:
+        f.write(secrets.token_hex(16))
+    os.chmod(master_key, 0o600)
+
+
+def create_rails_credentials(project_path, env=None):
+    """Write the app's config/credentials.yml.enc, with a fresh secret_key_base, under its master key
+
+    Needs the app's gems installed. With EDITOR=true, `rails credentials:edit`
+    saves Rails' default credentials (which hold secret_key_base) unchanged.
+    """
+    env = {**(env or os.environ), 'EDITOR': 'true'}
+    subprocess.run(['bin/rails', 'credentials:edit'], cwd=project_path, check=True, env=env,
+                   stdout=subprocess.DEVNULL)
+
+
+# Bundler
+
+def get_bundle_path(ruby_version):
+    """Get the BUNDLE_PATH shared by all aske Rails apps on a Ruby version"""
+    return get_cache_dir('bundler', f'ruby-{ruby_version}')
+
+
+def get_gemfile_lock_path(gemfile, ruby_version):
+    """Path of the cached Gemfile.lock resolved for a Gemfile"""
+    return os.path.join(get_cache_root(), 'bundler', 'locks', f'{cache_key(ruby_version, gemfile)}.lock')
+
+
+def restore_gemfile_lock(gemfile, ruby_version, project_path):
+    """Copy a cached Gemfile.lock into a project; returns False on a cache miss"""
+    lock_path = get_gemfile_lock_path(gemfile, ruby_version)
+    if not os.path.exists(lock_path):
+        return False
+    shutil.copyfile(lock_path, os.path.join(project_path, 'Gemfile.lock'))
+    return True
+
+
+def save_gemfile_lock(gemfile, ruby_version, project_path):
+    """Cache the Gemfile.lock a project resolved for its Gemfile"""
+    lock_path = get_gemfile_lock_path(gemfile, ruby_version)
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    shutil.copyfile(os.path.join(project_path, 'Gemfile.lock'), lock_path)
+
+
+def configure_bundler(project_path, ruby_version, jobs):
+    """Write .bundle/config so the project installs into the shared gem store"""
+    config_path = os.path.join(project_path, '.bundle', 'config')
+    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+    with open(config_path, 'w') as f:
+        f.write('---\n')
+        f.write(f'BUNDLE_PATH: "{get_bundle_path(ruby_version)}"\n')
+        f.write(f'BUNDLE_JOBS: "{jobs}"\n')
+
+
+# Laravel
+
+# Directory the cached skeleton is rendered in; Laravel does not embed it in any file
+LARAVEL_SKELETON_NAME = 'aske_skeleton_app'
+
+# .env holds the APP_KEY, which must never be shared between projects
+LARAVEL_SKELETON_SECRETS = ['.env']
+
+# Directories hardlinked from the skeleton, which doubles as the shared vendor store
+LARAVEL_SHARED_DIRS = ['vendor']
+
+# Files composer rewrites in place (autoloaders, installed package lists, bin
+# proxies) on every install, update or dump-autoload; each project gets copies
+LARAVEL_PROJECT_VENDOR_PATHS = ['vendor/autoload.php', 'vendor/composer', 'vendor/bin']
+
+
+def get_laravel_skeleton_dir(version, php_version, commands=()):
+    """Get the cache directory for a skeleton of a Laravel version"""
+    return os.path.join(get_cache_root(), 'laravel',
+                        cache_key(version, php_version, *(' '.join(command) for command in commands)))
+
+
+def get_laravel_skeleton(version, php_version, commands=()):
+    """Get the cached skeleton for a Laravel version, or None on a cache miss"""
+    skeleton = get_laravel_skeleton_dir(version, php_version, commands)
+    return skeleton if os.path.isdir(skeleton) else None
+
+
+def build_laravel_skeleton(version, php_version, commands=()):
+    """Run `composer create-project` once for a Laravel version and cache the result
+
+    commands are extra argv lists run inside the new project before it is
+    cached (e.g. installing Octane) and are part of the cache key.
+    """
+    skeleton = get_laravel_skeleton_dir(version, php_version, commands)
+    staging = make_staging_dir(skeleton)
+    try:
+        subprocess.run(['composer', 'create-project', '--prefer-dist',
+                        f'laravel/laravel:{version}', LARAVEL_SKELETON_NAME],
+                       cwd=staging, check=True)
+        rendered = os.path.join(staging, LARAVEL_SKELETON_NAME)
+        for command in commands:
+            subprocess.run(list(command), cwd=rendered, check=True)
+        for secret in LARAVEL_SKELETON_SECRETS:
+            secret_path = os.path.join(rendered, secret)
+            if os.path.exists(secret_path):
+                os.remove(secret_path)
+        publish_dir(rendered, skeleton)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return skeleton
+
+
+def materialize_laravel_skeleton(skeleton, project_path):
+    """Create a Laravel app from a cached skeleton, hardlinking its vendor packages
+
+    The app has no .env afterwards; write one and run `artisan key:generate`.
+    """
+    materialize_tree(skeleton, project_path, link_dirs=LARAVEL_SHARED_DIRS,
+                     copy_paths=LARAVEL_PROJECT_VENDOR_PATHS)
+
+
+# Yarn
+
+def get_yarn_offline_mirror():
+    """Get the yarn offline mirror shared by all aske Node projects"""
+    return get_cache_dir('yarn', 'offline-mirror')
+
+
+def get_yarn_cache_folder():
+    """Get the yarn cache used by aske projects
+
+    yarn only writes tarballs to the offline mirror when it downloads them, so
+    a dedicated cache guarantees everything in it also lands in the mirror.
+    """
+    return get_cache_dir('yarn', 'cache')
+
+
+def use_yarn_offline_mirror(project_path):
+    """Write a .yarnrc that makes yarn read and fill the shared offline mirror"""
+    with open(os.path.join(project_path, '.yarnrc'), 'w') as f:
+        f.write(f'yarn-offline-mirror "{get_yarn_offline_mirror()}"\n')
+        # Keep tarballs other projects still need when this one drops a package
+        f.write('yarn-offline-mirror-pruning false\n')
+        f.write(f'cache-folder "{get_yarn_cache_folder()}"\n')
+        # Serialize installs that share the cache, e.g. during `aske platform up`
+        f.write(f'--mutex file:{os.path.join(get_cache_root(), "yarn", ".mutex")}\n')
+
+
+def get_yarn_lock_path(package_json):
+    """Path of the cached yarn.lock resolved for a package.json's dependencies
+
+    Only the dependency sections are part of the key, so projects that differ
+    in name or scripts share a lockfile.
+    """
+    manifest = json.loads(package_json)
+    dependencies = {section: manifest.get(section, {})
+                    for section in ('dependencies', 'devDependencies', 'optionalDependencies')}
+    key = cache_key(json.dumps(dependencies, sort_keys=True))
+    return os.path.join(get_cache_root(), 'yarn', 'locks', f'{key}.lock')
+
+
+def is_yarn_warm(package_json):
+    """Check whether a package.json has a cached lockfile (and so a filled mirror)"""
+    return os.path.exists(get_yarn_lock_path(package_json))
+
+
+def restore_yarn_lock(package_json, project_path):
+    """Copy a cached yarn.lock into a project; returns False on a cache miss"""
+    lock_path = get_yarn_lock_path(package_json)
+    if not os.path.exists(lock_path):
+        return False
+    shutil.copyfile(lock_path, os.path.join(project_path, 'yarn.lock'))
+    return True
+
+
+def save_yarn_lock(package_json, project_path):
+    """Cache the yarn.lock a project resolved for its package.json"""
+    lock_path = get_yarn_lock_path(package_json)
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    shutil.copyfile(os.path.join(project_path, 'yarn.lock'), lock_path)
+
+
+def yarn_install(project_path, package_json):
+    """Install a project's dependencies through the shared offline mirror
+
+    With a cached lockfile the install runs with --offline --frozen-lockfile;
+    otherwise (or if the mirror is missing a tarball) it resolves online and
+    caches the new lockfile. The project needs the .yarnrc from
+    use_yarn_offline_mirror. Returns True when the install ran fully offline.
+    """
+    if restore_yarn_lock(package_json, project_path):
+        result = subprocess.run(['yarn', 'install', '--offline', '--frozen-lockfile'], cwd=project_path)
+        if result.returncode == 0:
+            return True
+
+    subprocess.run(['yarn', 'install', '--prefer-offline'], cwd=project_path, check=True)
+    save_yarn_lock(package_json, project_path)
+    return False
+
+
+# Generated projects
+
+# Project names a generator is rendered with to tell name-dependent files apart;
+# they differ in case and length so derived names (lower(), title()...) differ too
+GENERATION_PROBE_NAMES = ('askeprobe', 'AskeProbeOmega')
+
+def get_generation_manifest_path(generator, options):
+    """Path of the manifest of a generator invocation, keyed by its options and the aske version"""
+    key = cache_key(generator, json.dumps(options, sort_keys=True), __version__)
+    return os.path.join(get_cache_root(), 'generated', 'manifests', f'{key}.json')
+
+
+def get_generation_object_path(digest):
+    """Path of a cached file content in the content-addressed store"""
+    return os.path.join(get_cache_root(), 'generated', 'objects', digest[:2], digest)
+
+
+def store_generation_object(content):
+    """Add a file content to the store; returns its digest"""
+    data = content.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    path = get_generation_object_path(digest)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, staging = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # Hardlinked project files share this mode, so use the usual one, not mkstemp's 0600
+        os.chmod(staging, 0o644)
+        os.replace(staging, path)
+    return digest
+
+
+def get_generation_manifest(generator, options):
+    """Get {relative path: digest} of a generator's name-independent files, or None"""
+    try:
+        with open(get_generation_manifest_path(generator, options)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    static = manifest.get('static', {})
+    if not all(os.path.exists(get_generation_object_path(digest)) for digest in static.values()):
+        return None
+    return static
+
+
+def build_generation_manifest(generator, options, renderers):
+    """Find the files renderers(name) produces regardless of name and cache them
+
+    Templates are pure functions of their arguments, so rendering with two
+    different probe names and keeping the files that come out identical
+    yields everything that can be shared between projects.
+    """
+    first, second = ({file_path: render() for file_path, render in renderers(probe).items()}
+                     for probe in GENERATION_PROBE_NAMES)
+    static = {file_path: store_generation_object(content)
+              for file_path, content in first.items() if second.get(file_path) == content}
+
+    manifest_path = get_generation_manifest_path(generator, options)
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    fd, staging = tempfile.mkstemp(dir=os.path.dirname(manifest_path), suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump({'generator': generator, 'options': options, 'version': __version__,
+                   'static': static}, f, indent=2, sort_keys=True)
+    os.replace(staging, manifest_path)
+    return static
+
+
+def materialize_generated(generator, options, renderers, name, project_path):
+    """Write the files of a generator to project_path through the generation cache
+
+    renderers(name) returns {relative path: function returning the content}.
+    Name-independent files are cloned from the content-addressed store (see
+    clone_file) without being rendered; only the rest is rendered and written.
+    Returns (files, cached): the relative paths written and whether the
+    manifest was already cached.
+    """
+    static = get_generation_manifest(generator, options)
+    cached = static is not None
+    if not cached:
+        static = build_generation_manifest(generator, options, renderers)
+
+    files = renderers(name)
+    for file_path, render in files.items():
+        full_path = os.path.join(project_path, file_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if file_path in static:
+            clone_file(get_generation_object_path(static[file_path]), full_path)
+        else:
+            write_file(full_path, render())
+    return [*files], cached
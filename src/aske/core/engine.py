@@ -0,0 +1,225 @@
+"""Concurrent step engine for the external commands generators run"""
+import asyncio
+import os
+import subprocess
+import time
+
+# Steps are mostly network- and disk-bound tools, so allow more than one per CPU
+DEFAULT_CONCURRENCY = max(4, os.cpu_count() or 1)
+
+
+class StepError(Exception):
+    """A step failed, timed out or could not start"""
+
+    def __init__(self, step, message, output=''):
+        super().__init__(f"{step}: {message}")
+        self.step = step
+        self.output = output
+
+
+class StepResult:
+    """Outcome of a step; returncode is None when the command was not found or timed out"""
+
+    def __init__(self, name, returncode=0, output='', error='', duration=0.0, value=None,
+                 timeout=None, command=None):
+        self.name = name
+        self.command = command
+        self.returncode = returncode
+        self.output = output
+        self.error = error
+        self.duration = duration
+        self.value = value
+        self.timeout = timeout
+
+    @property
+    def timed_out(self):
+        return self.timeout is not None
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+    def check_found(self):
+        """Raise FileNotFoundError if the command is not installed, like subprocess.run
+
+        A command that timed out raises subprocess.TimeoutExpired instead.
+        """
+        if self.timed_out:
+            raise subprocess.TimeoutExpired(self.command or self.name, self.timeout, self.output, self.error)
+        if self.returncode is None:
+            raise FileNotFoundError(f"{self.name}: command not found")
+        return self
+
+    def check_returncode(self):
+        """Raise like CompletedProcess.check_returncode; returns the result otherwise"""
+        self.check_found()
+        if self.returncode != 0:
+            raise subprocess.CalledProcessError(self.returncode, self.name, self.output, self.error)
+        return self
+
+
+class Step:
+    """An external command or Python callable and the steps it runs after"""
+
+    def __init__(self, name, command=None, func=None, after=(), cwd=None, env=None,
+                 timeout=None, check=True, capture=True):
+        if (command is None) == (func is None):
+            raise ValueError(f"Step '{name}' needs exactly one of command or func")
+        self.name = name
+        self.command = list(command) if command is not None else None
+        self.func = func
+        self.after = [after] if isinstance(after, str) else list(after)
+        self.cwd = cwd
+        self.env = env
+        self.timeout = timeout
+        self.check = check
+        self.capture = capture
+
+
+class Engine:
+    """Run a DAG of steps, overlapping everything that does not depend on each other
+
+    Commands run through asyncio subprocesses and callables in worker threads,
+    at most max_concurrency at a time. The first failing step (non-zero exit,
+    timeout or exception, unless check=False) cancels everything still
+    running or waiting and is raised as a StepError.
+    """
+
+    def __init__(self, max_concurrency=None):
+        self.max_concurrency = max_concurrency or DEFAULT_CONCURRENCY
+        self.steps = {}
+
+    def add(self, name, command=None, func=None, after=(), **options):
+        """Add a step; see Step for the options"""
+        if name in self.steps:
+            raise ValueError(f"Duplicate step '{name}'")
+        self.steps[name] = Step(name, command=command, func=func, after=after, **options)
+        return self
+
+    def validate(self):
+        """Raise ValueError on unknown dependencies or dependency cycles"""
+        state = {}
+
+        def visit(name, path):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Step cycle: {' -> '.join(path[path.index(name):] + [name])}")
+            state[name] = 'visiting'
+            for dependency in self.steps[name].after:
+                if dependency not in self.steps:
+                    raise ValueError(f"Step '{name}' runs after unknown step '{dependency}'")
+                visit(dependency, path + [name])
+            state[name] = 'done'
+
+        for name in self.steps:
+            visit(name, [])
+
+    def run(self):
+        """Run every step and return {name: StepResult}"""
+        self.validate()
+        return asyncio.run(self._run_all())
+
+    async def _run_all(self):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = {}
+        for name in self._ordered():
+            tasks[name] = asyncio.ensure_future(self._run_step(self.steps[name], tasks, semaphore))
+
+        pending = set(tasks.values())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    if task.exception() is not None:
+                        raise task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    def _ordered(self):
+        """Step names with every step after the steps it depends on"""
+        ordered, seen = [], set()
+
+        def visit(name):
+            if name not in seen:
+                seen.add(name)
+                for dependency in self.steps[name].after:
+                    visit(dependency)
+                ordered.append(name)
+
+        for name in self.steps:
+            visit(name)
+        return ordered
+
+    async def _run_step(self, step, tasks, semaphore):
+        if step.after:
+            await asyncio.gather(*(tasks[dependency] for dependency in step.after))
+
+        async with semaphore:
+            started = time.monotonic()
+            if step.func is not None:
+                try:
+                    value = await asyncio.to_thread(step.func)
+                except Exception as e:
+                    raise StepError(step.name, str(e)) from e
+                return StepResult(step.name, duration=time.monotonic() - started, value=value)
+
+            returncode, output, error, timed_out = await self._run_command(step)
+            result = StepResult(step.name, returncode, output, error, time.monotonic() - started,
+                                timeout=step.timeout if timed_out else None, command=step.command)
+            if step.check and not result.ok:
+                if timed_out:
+                    raise StepError(step.name, f"timed out after {step.timeout}s")
+                if returncode is None:
+                    raise StepError(step.name, f"command not found: {step.command[0]}")
+                raise StepError(step.name, f"exited with status {returncode}", output + error)
+            return result
+
+    async def _run_command(self, step):
+        """Run a step's command and return (returncode, output, error, timed_out)
+
+        Captured output keeps concurrent steps from interleaving.
+        """
+        pipe = asyncio.subprocess.PIPE if step.capture else None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *step.command, cwd=step.cwd, env=step.env,
+                stdin=asyncio.subprocess.DEVNULL if step.capture else None,
+                stdout=pipe, stderr=pipe)
+        except FileNotFoundError:
+            return None, '', '', False
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), step.timeout)
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            return None, '', '', True
+        except asyncio.CancelledError:
+            await self._kill(process)
+            raise
+        return (process.returncode, (stdout or b'').decode('utf-8', 'replace'),
+                (stderr or b'').decode('utf-8', 'replace'), False)
+
+    @staticmethod
+    async def _kill(process):
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+def run_probes(commands, timeout=15):
+    """Run independent tool probes at once, e.g. {'go': ['go', 'version']}
+
+    Probes never fail the batch, even when they time out: check result.ok, or
+    use check_found() and check_returncode() to get the exceptions
+    subprocess.run would raise.
+    """
+    engine = Engine(max_concurrency=len(commands) or 1)
+    for name, command in commands.items():
+        engine.add(name, command=command, timeout=timeout, check=False)
+    return engine.run()
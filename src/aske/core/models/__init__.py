@@ -9,6 +9,7 @@ from .ruby import RubyModel
 from .spring import SpringModel
 from .laravel import LaravelModel
 from .go import GoBaseModel  # Import just what we need
+from .shell import ShellModel
 
 __all__ = [
     'GitignoreModel',
@@ -19,5 +20,6 @@ __all__ = [
     'RubyModel',
     'SpringModel',
     'LaravelModel',
-    'GoBaseModel'
+    'GoBaseModel',
+    'ShellModel'
 ] 
\ No newline at end of file
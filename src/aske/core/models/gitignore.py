@@ -1,75 +1,54 @@
+from aske.core.templates import load_template
+from aske.core.models.go.base import GoModel
+from aske.core.models.laravel import LaravelModel
+from aske.core.models.next import NextjsModel
+from aske.core.models.spring import SpringModel
+
 class GitignoreModel:
     """Model for generating .gitignore file content"""
 
     @staticmethod
     def get_python_gitignore():
         """Get standard Python .gitignore content"""
-        return '''# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-
-# Virtual Environment
-venv/
-ENV/
-env/
+        return load_template('gitignore/get_python_gitignore')
 
-# Environment variables
-.env
-.env.*
+    @staticmethod
+    def get_node_gitignore():
+        """Get standard Node.js .gitignore content"""
+        return load_template('gitignore/get_node_gitignore')
 
-# IDE
-.idea/
-.vscode/
-*.swp
-*.swo
-.project
-.pydevproject
+    @staticmethod
+    def get_aske_gitignore():
+        """Get the rules for files aske writes that must not be committed"""
+        return load_template('gitignore/get_aske_gitignore')
 
-# macOS
-.DS_Store
-.DS_STORE
-.AppleDouble
-.LSOverride
-._*
-.DocumentRevisions-V100
-.fseventsd
-.Spotlight-V100
-.TemporaryItems
-.Trashes
-.VolumeIcon.icns
-.com.apple.timemachine.donotpresent
+    @staticmethod
+    def get_stack_gitignore(stack):
+        """Get the .gitignore content of a stack: python, node, next, java, php or go"""
+        return {
+            'python': GitignoreModel.get_python_gitignore,
+            'node': GitignoreModel.get_node_gitignore,
+            'next': NextjsModel.get_gitignore,
+            'java': SpringModel.get_java_gitignore,
+            'php': LaravelModel.get_php_gitignore,
+            'go': GoModel.get_gitignore,
+        }[stack]()
 
-# Logs and databases
-*.log
-*.sqlite
-*.db
+    @staticmethod
+    def get_gitignore(stacks, existing=''):
+        """Compose the .gitignore of a project using the given stacks
 
-# Unit test / coverage reports
-htmlcov/
-.tox/
-.coverage
-.coverage.*
-.cache
-nosetests.xml
-coverage.xml
-*.cover
-.hypothesis/
-''' 
\ No newline at end of file
+        The rules of every stack are appended to the existing content, leaving
+        out those already present; comments and blank lines stay with the rules
+        they introduce.
+        """
+        seen = {line.strip() for line in existing.splitlines()}
+        sections = [existing.rstrip('\n')] if existing.strip() else []
+        for content in [GitignoreModel.get_aske_gitignore(), *map(GitignoreModel.get_stack_gitignore, stacks)]:
+            for block in content.strip('\n').split('\n\n'):
+                lines = [line for line in block.splitlines() if line.startswith('#') or line.strip() not in seen]
+                if not any(line.strip() and not line.startswith('#') for line in lines):
+                    continue
+                seen.update(line.strip() for line in lines)
+                sections.append('\n'.join(lines))
+        return '\n\n'.join(sections) + '\n'
@@ -1,12 +1,14 @@
 """Go project initialization models"""
 import os
+from aske.core.cache import write_files
+from aske.core.templates import load_template, render_template
 
 class GoModel:
     """Base model for pure Go projects"""
 
     @staticmethod
     def create_project_structure(path):
-        """Create the standard Go project directory structure"""
+        """Create the standard Go project directory structure; returns the files it wrote"""
         directories = [
             'cmd',
             'internal',
@@ -28,203 +30,57 @@ class GoModel:
         # Create cmd/main directory
         os.makedirs(os.path.join(path, 'cmd', 'main'), exist_ok=True)
 
-        # Create README files for each directory
-        for dir in directories:
-            readme_path = os.path.join(path, dir, 'README.md')
-            with open(readme_path, 'w') as f:
-                f.write(f'# {dir}\n\nThis directory contains {dir}-specific code and resources.\n')
+        # Copy the static README stub of each directory from the template pack
+        readmes = {f'{dir}/README.md': load_template(f'go/readmes/{dir}') for dir in directories}
+        write_files(path, readmes)
+        return [*readmes]
 
     @staticmethod
     def get_mod_file(name):
         """Generate go.mod content"""
-        return f'''module {name}
-
-go 1.21
-
-require (
-    github.com/joho/godotenv v1.5.1
-)
-'''
+        return render_template('go/base/get_mod_file', name=name)
 
     @staticmethod
     def get_main_file():
         """Generate main.go content"""
-        return '''package main
-
-import (
-    "fmt"
-    "log"
-    "net/http"
-    "os"
-
-    "github.com/joho/godotenv"
-)
-
-func main() {
-    if err := godotenv.Load(); err != nil {
-        log.Printf("Warning: .env file not found")
-    }
-
-    // Routes
-    http.HandleFunc("/ping", handlePing)
-    http.HandleFunc("/api/health", handleHealth)
-
-    port := os.Getenv("PORT")
-    if port == "" {
-        port = "8080"
-    }
-
-    log.Printf("Server starting on port %s", port)
-    log.Fatal(http.ListenAndServe(":"+port, nil))
-}
-
-func handlePing(w http.ResponseWriter, r *http.Request) {
-    fmt.Fprintf(w, `{"message": "pong"}`)
-}
-
-func handleHealth(w http.ResponseWriter, r *http.Request) {
-    w.Header().Set("Content-Type", "application/json")
-    fmt.Fprintf(w, `{"status": "ok"}`)
-}
-'''
+        return load_template('go/base/get_main_file')
 
     @staticmethod
     def get_env():
         """Generate .env content"""
-        return '''# Server Configuration
-PORT=8080
-ENV=development
-
-# Add your environment variables here
-'''
+        return load_template('go/base/get_env')
 
     @staticmethod
     def get_gitignore():
         """Generate .gitignore content"""
-        return '''# Binaries
-*.exe
-*.exe~
-*.dll
-*.so
-*.dylib
-bin/
-
-# Test binary, built with go test -c
-*.test
-
-# Output of the go coverage tool
-*.out
-
-# Dependency directories
-vendor/
-
-# Environment variables
-.env
-.env.*
-
-# IDE specific files
-.idea/
-.vscode/
-*.swp
-*.swo
-
-# OS specific files
-.DS_Store
-.DS_Store?
-._*
-.Spotlight-V100
-.Trashes
-'''
+        return load_template('go/base/get_gitignore')
 
     @staticmethod
     def get_readme(name):
         """Generate README.md content"""
-        return f'''# {name}
-
-A Go web application using the standard library.
-
-## Project Structure
-
-```
-.
-├── api/        # API related code
-├── cmd/        # Main applications
-├── configs/    # Configuration files
-├── docs/       # Documentation
-├── internal/   # Private application code
-├── pkg/        # Public library code
-├── scripts/    # Scripts for development
-└── test/       # Additional test files
-```
-
-## Getting Started
-
-1. Install dependencies:
-   ```bash
-   go mod download
-   go mod tidy
-   ```
-
-2. Run the application:
-   ```bash
-   go run cmd/main/main.go
-   ```
-
-3. Build the application:
-   ```bash
-   make build
-   ```
-
-4. Run tests:
-   ```bash
-   make test
-   ```
-
-## Development
-
-- Use `go fmt` to format code
-- Run `golangci-lint run` before commits
-- Write tests for new features
-- Update documentation as needed
-
-## License
-
-MIT
-'''
+        return render_template('go/base/get_readme', name=name)
 
     @staticmethod
     def get_makefile():
         """Generate Makefile content"""
-        return '''# Go parameters
-GOCMD=go
-GOBUILD=$(GOCMD) build
-GOCLEAN=$(GOCMD) clean
-GOTEST=$(GOCMD) test
-GOGET=$(GOCMD) get
-GOMOD=$(GOCMD) mod
-BINARY_NAME=app
-BINARY_UNIX=$(BINARY_NAME)_unix
-
-all: test build
-
-build:
-	$(GOBUILD) -o bin/$(BINARY_NAME) -v cmd/main/main.go
-
-test:
-	$(GOTEST) -v ./...
+        return load_template('go/base/get_makefile')
 
-clean:
-	$(GOCLEAN)
-	rm -f bin/$(BINARY_NAME)
-	rm -f bin/$(BINARY_UNIX)
+    @staticmethod
+    def get_dockerfile():
+        """Generate multi-stage Dockerfile content"""
+        return load_template('go/base/get_dockerfile')
 
-run:
-	$(GOBUILD) -o bin/$(BINARY_NAME) -v cmd/main/main.go
-	./bin/$(BINARY_NAME)
+    @staticmethod
+    def get_pprof_file():
+        """Generate pprof.go content, compiled only into profiling builds"""
+        return load_template('go/base/get_pprof_file')
 
-deps:
-	$(GOMOD) download
+    @staticmethod
+    def get_load_test():
+        """Generate test/load/main.go content"""
+        return load_template('go/base/get_load_test')
 
-tidy:
-	$(GOMOD) tidy
-''' 
\ No newline at end of file
+    @staticmethod
+    def get_dockerignore():
+        """Generate .dockerignore content"""
+        return load_template('go/base/get_dockerignore')
@@ -1,9 +1,24 @@
+from aske.core.templates import load_template, render_template
+
 class LaravelModel:
     """Model for generating Laravel project structure and files"""
 
     @staticmethod
-    def get_composer_json(name):
+    def get_perf_packages():
+        """Composer packages added by the performance profile"""
+        return {
+            'laravel/octane': '^2.5',
+            'spiral/roadrunner-cli': '^2.6',
+            'spiral/roadrunner-http': '^3.3',
+        }
+
+    @staticmethod
+    def get_composer_json(name, perf=False):
         """Generate composer.json content"""
+        perf_requires = ''
+        if perf:
+            perf_requires = ''.join(f',\n        "{package}": "{version}"'
+                                    for package, version in LaravelModel.get_perf_packages().items())
         return f'''{{
     "name": "aske/{name}",
     "type": "project",
@@ -14,7 +29,7 @@ class LaravelModel:
         "php": "^8.2",
         "laravel/framework": "^11.0",
         "laravel/sanctum": "^4.0",
-        "laravel/tinker": "^2.9"
+        "laravel/tinker": "^2.9"{perf_requires}
     }},
     "require-dev": {{
         "fakerphp/faker": "^1.23",
@@ -69,9 +84,11 @@ class LaravelModel:
 }}'''
 
     @staticmethod
-    def get_env():
+    def get_env(perf=False, name='Laravel'):
         """Generate .env content"""
-        return '''APP_NAME=Laravel
+        if perf:
+            return LaravelModel.get_perf_env(name)
+        return f'''APP_NAME="{name}"
 APP_ENV=local
 APP_KEY=
 APP_DEBUG=true
@@ -108,144 +125,52 @@ MAIL_USERNAME=null
 MAIL_PASSWORD=null
 MAIL_ENCRYPTION=null
 MAIL_FROM_ADDRESS="hello@example.com"
-MAIL_FROM_NAME="${APP_NAME}"'''
+MAIL_FROM_NAME="${{APP_NAME}}"'''
 
     @staticmethod
-    def get_hello_controller():
-        """Generate HelloController class"""
-        return '''<?php
+    def get_perf_env(name='Laravel'):
+        """Generate .env content for the performance profile"""
+        return render_template('laravel/get_perf_env', name=name)
 
-namespace App\Http\Controllers;
+    @staticmethod
+    def get_opcache_ini():
+        """Generate php/opcache.ini content tuned for production"""
+        return load_template('laravel/get_opcache_ini')
+
+    @staticmethod
+    def get_preload_php():
+        """Generate preload.php content"""
+        return load_template('laravel/get_preload_php')
 
-use Illuminate\Http\Request;
+    @staticmethod
+    def get_makefile():
+        """Generate Makefile content for the performance profile"""
+        return load_template('laravel/get_makefile')
 
-class HelloController extends Controller
-{
-    public function index()
-    {
-        return 'Hello, World!';
-    }
-}
-'''
+    @staticmethod
+    def get_hello_controller():
+        """Generate HelloController class"""
+        return load_template('laravel/get_hello_controller')
 
     @staticmethod
     def get_hello_test():
         """Generate HelloController test"""
-        return '''<?php
-
-namespace Tests\Feature;
-
-use Tests\TestCase;
-
-class HelloControllerTest extends TestCase
-{
-    public function test_hello_endpoint_returns_hello_world()
-    {
-        $response = $this->get('/hello');
-
-        $response->assertStatus(200);
-        $response->assertSeeText('Hello, World!');
-    }
-}
-'''
+        return load_template('laravel/get_hello_test')
 
     @staticmethod
     def get_phpunit_xml():
         """Generate phpunit.xml content"""
-        return '''<?xml version="1.0" encoding="UTF-8"?>
-<phpunit xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-         xsi:noNamespaceSchemaLocation="vendor/phpunit/phpunit/phpunit.xsd"
-         bootstrap="vendor/autoload.php"
-         colors="true"
->
-    <testsuites>
-        <testsuite name="Unit">
-            <directory>tests/Unit</directory>
-        </testsuite>
-        <testsuite name="Feature">
-            <directory>tests/Feature</directory>
-        </testsuite>
-    </testsuites>
-    <source>
-        <include>
-            <directory>app</directory>
-        </include>
-    </source>
-    <php>
-        <env name="APP_ENV" value="testing"/>
-        <env name="BCRYPT_ROUNDS" value="4"/>
-        <env name="CACHE_DRIVER" value="array"/>
-        <env name="DB_DATABASE" value="testing"/>
-        <env name="MAIL_MAILER" value="array"/>
-        <env name="QUEUE_CONNECTION" value="sync"/>
-        <env name="SESSION_DRIVER" value="array"/>
-        <env name="TELESCOPE_ENABLED" value="false"/>
-    </php>
-</phpunit>
-'''
+        return load_template('laravel/get_phpunit_xml')
 
     @staticmethod
     def get_php_gitignore():
         """Get standard Laravel .gitignore content"""
-        return '''/.phpunit.cache
-/node_modules
-/public/build
-/public/hot
-/public/storage
-/storage/*.key
-/vendor
-.env
-.env.backup
-.env.production
-.phpunit.result.cache
-Homestead.json
-Homestead.yaml
-auth.json
-npm-debug.log
-yarn-error.log
-/.fleet
-/.idea
-/.vscode
-
-# Laravel specific
-/bootstrap/cache/*
-/storage/framework/cache/*
-/storage/framework/sessions/*
-/storage/framework/views/*
-/storage/logs/*
-
-# macOS
-.DS_Store
-.AppleDouble
-.LSOverride
-._*
-
-# Composer
-composer.phar
-/vendor/
-
-# PHP CS Fixer
-.php_cs
-.php_cs.cache
-.php-cs-fixer.cache
-
-# PHPStorm
-.idea/
-*.iml
-*.iws
-
-# VS Code
-.vscode/
-*.code-workspace
-
-# Logs and databases
-*.log
-*.sqlite
-'''
+        return load_template('laravel/get_php_gitignore')
 
     @staticmethod
-    def get_readme(name):
+    def get_readme(name, perf=False):
         """Generate README.md content"""
+        perf_section = LaravelModel.get_perf_readme_section() if perf else ''
         return f'''# {name}
 
 A Laravel application created with ASKE.
@@ -301,6 +226,10 @@ http://localhost:8000/hello
 - Routes are in `routes/web.php` and `routes/api.php`
 - Views are in `resources/views`
 - Tests are in `tests` directory
+- The packages in `vendor/` are hardlinked from the aske Laravel skeleton cache,
+  while `vendor/composer/`, `vendor/bin/` and `vendor/autoload.php`, which composer
+  rewrites in place, are copies of this project's own; never edit files of a package
+  in `vendor/` in place, or every project sharing it changes too
 
 ## Testing
 
@@ -315,4 +244,9 @@ Fix code style with Laravel Pint:
 ```bash
 ./vendor/bin/pint
 ```
-''' 
\ No newline at end of file
+{perf_section}'''
+
+    @staticmethod
+    def get_perf_readme_section():
+        """Generate README section for the performance profile"""
+        return load_template('laravel/get_perf_readme_section')
\ No newline at end of file
@@ -1,55 +1,160 @@
+import os
+from aske.core.templates import load_template, render_template
+
+
 class NextjsModel:
     """Model for generating Next.js project structure and files"""
 
+    # Versions the templates are written against (app router, React 18)
+    NEXT_VERSION = '14.2.15'
+
     @staticmethod
-    def get_model_prompt_component():
-        """Generate ModelPrompt component"""
-        return '''"use client";
+    def get_package_json(name, perf=False):
+        """Generate package.json content"""
+        analyze_script = ',\n    "analyze": "ANALYZE=true next build"' if perf else ''
+        analyzer_dependency = f'\n    "@next/bundle-analyzer": "{NextjsModel.NEXT_VERSION}",' if perf else ''
+        return f'''{{
+  "name": "{name}",
+  "version": "0.1.0",
+  "private": true,
+  "scripts": {{
+    "dev": "next dev",
+    "build": "next build",
+    "start": "next start",
+    "lint": "next lint"{analyze_script}
+  }},
+  "dependencies": {{
+    "next": "{NextjsModel.NEXT_VERSION}",
+    "react": "^18",
+    "react-dom": "^18"
+  }},
+  "devDependencies": {{{analyzer_dependency}
+    "@types/node": "^20",
+    "@types/react": "^18",
+    "@types/react-dom": "^18",
+    "eslint": "^8",
+    "eslint-config-next": "{NextjsModel.NEXT_VERSION}",
+    "typescript": "^5"
+  }}
+}}
+'''
 
-import { useState } from 'react';
+    @staticmethod
+    def get_tsconfig():
+        """Generate tsconfig.json content"""
+        return load_template('next/get_tsconfig')
 
-interface ModelPromptProps {
-  onSubmit: (input: string) => void;
-}
+    @staticmethod
+    def get_next_config(perf=False):
+        """Generate next.config.mjs content"""
+        if perf:
+            return NextjsModel.get_perf_next_config()
+        return '''/** @type {import('next').NextConfig} */
+const nextConfig = {};
 
-const ModelPrompt: React.FC<ModelPromptProps> = ({ onSubmit }) => {
-  const [input, setInput] = useState('');
+export default nextConfig;
+'''
 
-  const handleSubmit = (e: React.FormEvent) => {
-    e.preventDefault();
-    if (!input.trim()) return;
-    onSubmit(input.trim());
-    setInput('');
-  };
+    @staticmethod
+    def get_perf_next_config():
+        """Generate next.config.mjs content for the performance preset"""
+        return load_template('next/get_perf_next_config')
 
-  return (
-    <div style={{ margin: '2rem 0' }}>
-      <h2>Model Prompt</h2>
-      <form onSubmit={handleSubmit}>
-        <input
-          type="text"
-          placeholder="Enter your prompt..."
-          value={input}
-          onChange={(e) => setInput(e.target.value)}
-          style={{ padding: '0.5rem', width: '300px', marginRight: '1rem' }}
-        />
-        <button type="submit" style={{ padding: '0.5rem 1rem' }}>
-          Submit
-        </button>
-      </form>
-    </div>
-  );
-};
+    @staticmethod
+    def get_next_env():
+        """Generate next-env.d.ts content"""
+        return load_template('next/get_next_env')
 
-export default ModelPrompt;
-'''
+    @staticmethod
+    def get_eslintrc():
+        """Generate .eslintrc.json content"""
+        return load_template('next/get_eslintrc')
+
+    @staticmethod
+    def get_gitignore():
+        """Generate .gitignore content"""
+        return load_template('next/get_gitignore')
+
+    @staticmethod
+    def get_layout(name):
+        """Generate src/app/layout.tsx content"""
+        return render_template('next/get_layout', name=name)
+
+    @staticmethod
+    def get_globals_css():
+        """Generate src/app/globals.css content"""
+        return load_template('next/get_globals_css')
+
+    @staticmethod
+    def get_readme(name, perf=False):
+        """Generate README.md content"""
+        perf_section = NextjsModel.get_perf_readme_section() if perf else ''
+        return f'''# {name}
+
+A Next.js application (app router, TypeScript) created with ASKE.
+
+## Development
+
+```bash
+yarn install --prefer-offline  # Install, reusing the aske offline mirror
+yarn dev                      # Start the development server
+```
+
+Open [http://localhost:3000](http://localhost:3000) to see the app.
+
+## Structure
+
+- `src/app/`: Routes, layouts and global styles
+- `src/components/`: Shared components (`ModelPrompt`)
+- `@/*` resolves to `src/*`
+
+## Dependencies
+
+`.yarnrc` points yarn at the shared offline mirror in the aske cache, so
+packages downloaded once are reused by every project.
+{perf_section}'''
+
+    @staticmethod
+    def get_perf_readme_section():
+        """Generate README section for the performance preset"""
+        return load_template('next/get_perf_readme_section')
+
+    @staticmethod
+    def get_project_renderers(name, perf=False):
+        """Map project-relative paths to functions rendering their contents"""
+        return {
+            'package.json': lambda: NextjsModel.get_package_json(name, perf),
+            'tsconfig.json': NextjsModel.get_tsconfig,
+            'next.config.mjs': lambda: NextjsModel.get_next_config(perf),
+            'next-env.d.ts': NextjsModel.get_next_env,
+            '.eslintrc.json': NextjsModel.get_eslintrc,
+            '.gitignore': NextjsModel.get_gitignore,
+            'README.md': lambda: NextjsModel.get_readme(name, perf),
+            os.path.join('src', 'app', 'layout.tsx'): lambda: NextjsModel.get_layout(name),
+            os.path.join('src', 'app', 'globals.css'): NextjsModel.get_globals_css,
+            os.path.join('src', 'app', 'page.tsx'): lambda: NextjsModel.get_index_page(perf),
+            os.path.join('src', 'components', 'ModelPrompt.tsx'): NextjsModel.get_model_prompt_component,
+        }
+
+    @staticmethod
+    def get_project_files(name, perf=False):
+        """Map project-relative paths to generated file contents"""
+        return {file_path: render() for file_path, render in
+                NextjsModel.get_project_renderers(name, perf).items()}
+
+    @staticmethod
+    def get_model_prompt_component():
+        """Generate ModelPrompt component"""
+        return load_template('next/get_model_prompt_component')
 
     @staticmethod
-    def get_index_page():
+    def get_index_page(perf=False):
         """Generate index page with ModelPrompt"""
+        if perf:
+            return NextjsModel.get_server_index_page()
         return '''"use client";
 
-import ModelPrompt from '../components/ModelPrompt';
+import ModelPrompt from '@/components/ModelPrompt';
 
 export default function Home() {
   const handlePromptSubmit = (input: string) => {
@@ -65,4 +170,9 @@ export default function Home() {
     </div>
   );
 }
-''' 
\ No newline at end of file
+'''
+
+    @staticmethod
+    def get_server_index_page():
+        """Generate index page as a server component with ModelPrompt as the client island"""
+        return load_template('next/get_server_index_page')
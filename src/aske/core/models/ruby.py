@@ -1,204 +1,32 @@
+from aske.core.templates import load_template, render_template
+
 class RubyModel:
     """Model for generating Ruby on Rails project structure and files"""
 
     @staticmethod
     def get_gemfile():
         """Generate Gemfile content"""
-        return '''source "https://rubygems.org"
-git_source(:github) { |repo| "https://github.com/#{repo}.git" }
-
-ruby "3.2.0"
-
-# Rails version
-gem "rails", "~> 7.1.0"
-
-# Use PostgreSQL as the database
-gem "pg"
-
-# Use Puma as the app server
-gem "puma"
-
-# Boot large ruby/rails apps faster
-gem "bootsnap", require: false
-
-# API gems
-gem "jbuilder"
-gem "rack-cors"
-
-# Authentication & Authorization
-gem "devise"
-gem "pundit"
-
-# Environment variables
-gem "dotenv-rails"
-
-# Monitoring & Logging
-gem "newrelic_rpm"
-gem "lograge"
-
-# Testing
-group :development, :test do
-  gem "rspec-rails"
-  gem "factory_bot_rails"
-  gem "faker"
-  gem "pry-byebug"
-end
-
-# Development tools
-group :development do
-  gem "rubocop", require: false
-  gem "rubocop-rails", require: false
-  gem "brakeman", require: false
-  gem "annotate"
-  gem "letter_opener"
-end
-'''
+        return load_template('ruby/get_gemfile')
 
     @staticmethod
     def get_rubocop():
         """Generate .rubocop.yml content"""
-        return '''AllCops:
-  NewCops: enable
-  Exclude:
-    - "db/**/*"
-    - "bin/**/*"
-    - "config/**/*"
-    - "Guardfile"
-    - "Rakefile"
-    - "node_modules/**/*"
-
-Documentation:
-  Enabled: false
-
-Style/FrozenStringLiteralComment:
-  Enabled: false
-
-Style/ClassAndModuleChildren:
-  Enabled: false
-
-Style/SafeNavigation:
-  Enabled: false
-
-Metrics/ClassLength:
-  Max: 150
-
-Metrics/ModuleLength:
-  Max: 150
-
-Metrics/MethodLength:
-  Max: 20
-
-Metrics/AbcSize:
-  Max: 50
-'''
+        return load_template('ruby/get_rubocop')
 
     @staticmethod
     def get_rspec():
         """Generate .rspec content"""
-        return '''--require spec_helper
---format documentation
---color
-'''
+        return load_template('ruby/get_rspec')
 
     @staticmethod
     def get_env():
         """Generate .env content"""
-        return '''# Database configuration
-DATABASE_URL=postgres://localhost/myapp_development
-
-# Rails configuration
-RAILS_ENV=development
-RAILS_MAX_THREADS=5
-
-# App configuration
-APP_HOST=localhost:3000
-
-# Secrets
-SECRET_KEY_BASE=development_secret
-
-# Third-party services
-# STRIPE_API_KEY=
-# AWS_ACCESS_KEY_ID=
-# AWS_SECRET_ACCESS_KEY=
-'''
+        return load_template('ruby/get_env')
 
     @staticmethod
     def get_readme(name):
         """Generate README.md content"""
-        return f'''# {name}
-
-## Requirements
-
-- rbenv (Ruby Version Manager)
-- Ruby 3.2.0+ (installed via rbenv)
-- Rails 7.1.0+
-- PostgreSQL 13+
-
-## Setup
-
-1. Ensure rbenv and Ruby are properly set up:
-```bash
-# Install rbenv if not installed
-brew install rbenv ruby-build
-
-# Add to your shell
-eval "$(rbenv init -)"
-
-# Install Ruby
-rbenv install 3.2.0
-rbenv global 3.2.0
-
-# Install Rails
-gem install rails -v 7.1.0
-rbenv rehash  # Make Rails executable available
-```
-
-2. Install dependencies:
-```bash
-bundle install
-```
-
-3. Setup database:
-```bash
-rails db:create db:migrate
-```
-
-4. Start the server:
-```bash
-rails server
-```
-
-## Testing
-
-Run the test suite:
-```bash
-bundle exec rspec
-```
-
-## Code Quality
-
-Run the linters:
-```bash
-bundle exec rubocop
-bundle exec brakeman
-```
-
-## API Documentation
-
-API documentation is available at `/api/docs` when running in development mode.
-
-## Deployment
-
-This application is configured for deployment on Heroku or similar platforms.
-
-## Contributing
-
-1. Fork the repository
-2. Create your feature branch
-3. Commit your changes
-4. Push to the branch
-5. Create a Pull Request
-'''
+        return render_template('ruby/get_readme', name=name)
 
     @staticmethod
     def get_application_rb(name):
@@ -224,4 +52,39 @@ module {module_name}
     config.api_only = true
   end
 end
-''' 
\ No newline at end of file
+''' 
+
+    @staticmethod
+    def get_puma_rb():
+        """Generate config/puma.rb content"""
+        return load_template('ruby/get_puma_rb')
+
+    @staticmethod
+    def get_boot_rb():
+        """Generate config/boot.rb content"""
+        return load_template('ruby/get_boot_rb')
+
+    @staticmethod
+    def get_database_yml(name):
+        """Generate config/database.yml content"""
+        database_name = name.replace('-', '_')
+        return f'''default: &default
+  adapter: postgresql
+  encoding: unicode
+  # One connection per Puma thread (RAILS_MAX_THREADS) plus one for background work
+  pool: <%= ENV.fetch("DB_POOL") {{ ENV.fetch("RAILS_MAX_THREADS", 5).to_i + 1 }} %>
+  checkout_timeout: <%= ENV.fetch("DB_CHECKOUT_TIMEOUT", 5) %>
+
+development:
+  <<: *default
+  database: {database_name}_development
+
+test:
+  <<: *default
+  database: {database_name}_test
+
+production:
+  <<: *default
+  database: {database_name}_production
+  url: <%= ENV["DATABASE_URL"] %>
+'''
@@ -0,0 +1,190 @@
+from aske.core.templates import load_template
+
+class ShellModel:
+    """Model for generating shell integration that activates venvs without Python"""
+
+    @staticmethod
+    def get_init(shell, auto=False):
+        """Generate the shell-init script for bash, zsh, fish or pwsh"""
+        return {
+            'bash': ShellModel.get_bash_init,
+            'zsh': ShellModel.get_zsh_init,
+            'fish': ShellModel.get_fish_init,
+            'pwsh': ShellModel.get_pwsh_init,
+        }[shell](auto)
+
+    @staticmethod
+    def get_posix_functions():
+        """Generate the venv lookup and aske-activate functions shared by bash and zsh"""
+        return load_template('shell/get_posix_functions')
+
+    @staticmethod
+    def get_bash_init(auto=False):
+        """Generate the bash shell-init script"""
+        hook = ''
+        if auto:
+            hook = '''
+_aske_cd_hook() {
+  if [ "$PWD" != "$_aske_hook_pwd" ]; then
+    _aske_hook_pwd="$PWD"
+    _aske_auto_activate
+  fi
+}
+
+case ";$PROMPT_COMMAND;" in
+  *";_aske_cd_hook;"*) ;;
+  *) PROMPT_COMMAND="_aske_cd_hook${PROMPT_COMMAND:+;$PROMPT_COMMAND}" ;;
+esac
+'''
+        return f'''# aske shell integration for bash
+# Add to ~/.bashrc: eval "$(aske shell-init bash{' --auto' if auto else ''})"
+{ShellModel.get_posix_functions()}{hook}'''
+
+    @staticmethod
+    def get_zsh_init(auto=False):
+        """Generate the zsh shell-init script"""
+        hook = ''
+        if auto:
+            hook = '''
+autoload -Uz add-zsh-hook
+add-zsh-hook chpwd _aske_auto_activate
+_aske_auto_activate
+'''
+        return f'''# aske shell integration for zsh
+# Add to ~/.zshrc: eval "$(aske shell-init zsh{' --auto' if auto else ''})"
+{ShellModel.get_posix_functions()}{hook}'''
+
+    @staticmethod
+    def get_fish_init(auto=False):
+        """Generate the fish shell-init script"""
+        hook = ''
+        if auto:
+            hook = '''
+function _aske_auto_activate --on-variable PWD
+    _aske_find_venv
+    if test -n "$_aske_venv_path"
+        if test "$VIRTUAL_ENV" != "$_aske_venv_path"
+            source "$_aske_venv_path/bin/activate.fish"
+            set -g _aske_auto_venv $_aske_venv_path
+        end
+    else if test -n "$_aske_auto_venv"; and test "$VIRTUAL_ENV" = "$_aske_auto_venv"
+        deactivate
+        set -e _aske_auto_venv
+    end
+end
+
+_aske_auto_activate
+'''
+        return f'''# aske shell integration for fish
+# Add to ~/.config/fish/config.fish: aske shell-init fish{' --auto' if auto else ''} | source
+
+# Last lookup: the directory it ran in and the venv it found (empty if none)
+set -g _aske_venv_dir ""
+set -g _aske_venv_path ""
+
+function _aske_find_venv
+    if test "$PWD" = "$_aske_venv_dir"
+        if test -z "$_aske_venv_path"; or test -f "$_aske_venv_path/bin/activate.fish"
+            return 0
+        end
+    end
+    set -g _aske_venv_dir $PWD
+    set -g _aske_venv_path ""
+    set -l dir $PWD
+    while test -n "$dir"
+        if test -f "$dir/venv/bin/activate.fish"
+            set -g _aske_venv_path "$dir/venv"
+            return 0
+        end
+        set dir (string replace -r '/[^/]*$' '' -- $dir)
+    end
+end
+
+function aske-activate
+    _aske_find_venv
+    if test -z "$_aske_venv_path"
+        echo "aske: no venv found in $PWD or its parents" >&2
+        return 1
+    end
+    if test "$VIRTUAL_ENV" != "$_aske_venv_path"
+        source "$_aske_venv_path/bin/activate.fish"
+    end
+end
+{hook}'''
+
+    @staticmethod
+    def get_pwsh_init(auto=False):
+        """Generate the PowerShell shell-init script"""
+        hook = ''
+        if auto:
+            hook = '''
+function global:Invoke-AskeAutoActivate {
+    $venv = Find-AskeVenv
+    if ($venv) {
+        if ($env:VIRTUAL_ENV -ne $venv) {
+            . (Get-AskeActivateScript $venv)
+            $global:AskeAutoVenv = $venv
+        }
+    } elseif ($global:AskeAutoVenv -and $env:VIRTUAL_ENV -eq $global:AskeAutoVenv) {
+        deactivate
+        $global:AskeAutoVenv = $null
+    }
+}
+
+if (-not $global:AskeOriginalPrompt) {
+    $global:AskeOriginalPrompt = $function:prompt
+    function global:prompt {
+        $location = (Get-Location).ProviderPath
+        if ($location -ne $global:AskeHookLocation) {
+            $global:AskeHookLocation = $location
+            Invoke-AskeAutoActivate
+        }
+        & $global:AskeOriginalPrompt
+    }
+}
+'''
+        return f'''# aske shell integration for PowerShell
+# Add to $PROFILE: aske shell-init pwsh{' --auto' if auto else ''} | Out-String | Invoke-Expression
+
+# Last lookup: the directory it ran in and the venv it found ($null if none)
+$global:AskeVenvDir = $null
+$global:AskeVenvPath = $null
+
+function global:Get-AskeActivateScript($venv) {{
+    foreach ($script in @('Scripts/Activate.ps1', 'bin/Activate.ps1')) {{
+        $path = Join-Path $venv $script
+        if (Test-Path -LiteralPath $path) {{ return $path }}
+    }}
+    return $null
+}}
+
+function global:Find-AskeVenv {{
+    $location = (Get-Location).ProviderPath
+    if ($location -eq $global:AskeVenvDir -and (-not $global:AskeVenvPath -or (Get-AskeActivateScript $global:AskeVenvPath))) {{
+        return $global:AskeVenvPath
+    }}
+    $global:AskeVenvDir = $location
+    $global:AskeVenvPath = $null
+    $dir = $location
+    while ($dir) {{
+        $venv = Join-Path $dir 'venv'
+        if (Get-AskeActivateScript $venv) {{
+            $global:AskeVenvPath = $venv
+            break
+        }}
+        $dir = Split-Path -Parent $dir
+    }}
+    return $global:AskeVenvPath
+}}
+
+function global:aske-activate {{
+    $venv = Find-AskeVenv
+    if (-not $venv) {{
+        Write-Error "aske: no venv found in $((Get-Location).ProviderPath) or its parents"
+        return
+    }}
+    if ($env:VIRTUAL_ENV -ne $venv) {{
+        . (Get-AskeActivateScript $venv)
+    }}
+}}
+{hook}'''
@@ -1,9 +1,19 @@
+import os
+from aske.core.templates import load_template, render_template
+
 class SpringModel:
     """Model for generating Spring Boot project structure and files"""
 
     @staticmethod
-    def get_pom_xml(name):
+    def get_pom_xml(name, perf=False, datasource=None):
         """Generate pom.xml content"""
+        # The perf profile needs Java 21 for virtual threads and Boot 3.3 for jarmode tools (CDS)
+        java_version = '21' if perf else '17'
+        boot_version = '3.3.5' if perf else '3.2.0'
+        profiles = SpringModel.get_benchmark_profile()
+        if perf:
+            profiles += SpringModel.get_native_ready_profile()
+        datasource_dependencies = SpringModel.get_datasource_dependencies(datasource) if datasource else ''
         return f'''<?xml version="1.0" encoding="UTF-8"?>
 <project xmlns="http://maven.apache.org/POM/4.0.0"
          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
@@ -13,7 +23,7 @@ class SpringModel:
     <parent>
         <groupId>org.springframework.boot</groupId>
         <artifactId>spring-boot-starter-parent</artifactId>
-        <version>3.2.0</version>
+        <version>{boot_version}</version>
     </parent>
 
     <groupId>com.example</groupId>
@@ -23,7 +33,7 @@ class SpringModel:
     <description>Spring Boot project created with ASKE</description>
 
     <properties>
-        <java.version>17</java.version>
+        <java.version>{java_version}</java.version>
         <project.build.sourceEncoding>UTF-8</project.build.sourceEncoding>
         <project.reporting.outputEncoding>UTF-8</project.reporting.outputEncoding>
     </properties>
@@ -40,7 +50,7 @@ class SpringModel:
         <dependency>
             <groupId>org.springframework.boot</groupId>
             <artifactId>spring-boot-starter-validation</artifactId>
-        </dependency>
+        </dependency>{datasource_dependencies}
         <dependency>
             <groupId>org.springframework.boot</groupId>
             <artifactId>spring-boot-devtools</artifactId>
@@ -60,6 +70,14 @@ class SpringModel:
                 <groupId>org.springframework.boot</groupId>
                 <artifactId>spring-boot-maven-plugin</artifactId>
             </plugin>
+            <plugin>
+                <!-- Wall-clock latency benchmarks are flaky on shared CI machines: see -Pbenchmark -->
+                <groupId>org.apache.maven.plugins</groupId>
+                <artifactId>maven-surefire-plugin</artifactId>
+                <configuration>
+                    <excludedGroups>benchmark</excludedGroups>
+                </configuration>
+            </plugin>
             <plugin>
                 <groupId>org.apache.maven.plugins</groupId>
                 <artifactId>maven-checkstyle-plugin</artifactId>
@@ -70,9 +88,41 @@ class SpringModel:
             </plugin>
         </plugins>
     </build>
+
+    <profiles>
+{profiles}    </profiles>
 </project>
 '''
 
+    @staticmethod
+    def get_datasource_dependencies(datasource):
+        """Generate JDBC starter and driver dependencies for a datasource"""
+        drivers = {
+            'postgresql': ('org.postgresql', 'postgresql'),
+            'mysql': ('com.mysql', 'mysql-connector-j'),
+        }
+        group_id, artifact_id = drivers[datasource]
+        return f'''
+        <dependency>
+            <groupId>org.springframework.boot</groupId>
+            <artifactId>spring-boot-starter-jdbc</artifactId>
+        </dependency>
+        <dependency>
+            <groupId>{group_id}</groupId>
+            <artifactId>{artifact_id}</artifactId>
+            <scope>runtime</scope>
+        </dependency>'''
+
+    @staticmethod
+    def get_benchmark_profile():
+        """Generate the benchmark Maven profile, the only build that runs @Tag("benchmark") tests"""
+        return load_template('spring/get_benchmark_profile')
+
+    @staticmethod
+    def get_native_ready_profile():
+        """Generate the native-ready Maven profile (AOT processing and CDS archive)"""
+        return load_template('spring/get_native_ready_profile')
+
     @staticmethod
     def get_application_class(name):
         """Generate main Application class"""
@@ -157,11 +207,104 @@ class HelloControllerTest {{
 '''
 
     @staticmethod
-    def get_application_properties():
+    def get_benchmark_test(name):
+        """Generate smoke benchmark test for the hello endpoint"""
+        package_name = name.replace("-", "").lower()
+        return f'''package com.example.{package_name}.controller;
+
+import java.net.URI;
+import java.net.http.HttpClient;
+import java.net.http.HttpRequest;
+import java.net.http.HttpResponse;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+
+import org.junit.jupiter.api.Tag;
+import org.junit.jupiter.api.Test;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.boot.test.web.server.LocalServerPort;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+/**
+ * Smoke benchmark: drives /hello over real HTTP and fails on gross latency regressions.
+ * Excluded from the default build; run with ./mvnw -Pbenchmark test
+ */
+@Tag("benchmark")
+@SpringBootTest(webEnvironment = SpringBootTest.WebEnvironment.RANDOM_PORT)
+class HelloControllerBenchmarkTest {{
+    private static final int WARMUP_REQUESTS = 200;
+    private static final int REQUESTS = Integer.getInteger("benchmark.requests", 2000);
+    private static final int CONCURRENCY = Integer.getInteger("benchmark.concurrency", 16);
+    private static final long P99_BUDGET_MS = Long.getLong("benchmark.p99.ms", 250);
+
+    @LocalServerPort
+    private int port;
+
+    @Test
+    void helloEndpointStaysWithinLatencyBudget() throws Exception {{
+        HttpClient client = HttpClient.newHttpClient();
+        HttpRequest request = HttpRequest.newBuilder(URI.create("http://localhost:" + port + "/hello")).build();
+
+        for (int i = 0; i < WARMUP_REQUESTS; i++) {{
+            client.send(request, HttpResponse.BodyHandlers.discarding());
+        }}
+
+        ExecutorService executor = Executors.newFixedThreadPool(CONCURRENCY);
+        List<Future<Long>> timings = new ArrayList<>();
+        long started = System.nanoTime();
+        for (int i = 0; i < REQUESTS; i++) {{
+            timings.add(executor.submit(() -> {{
+                long start = System.nanoTime();
+                HttpResponse<Void> response = client.send(request, HttpResponse.BodyHandlers.discarding());
+                assertEquals(200, response.statusCode());
+                return System.nanoTime() - start;
+            }}));
+        }}
+
+        List<Long> latencies = new ArrayList<>();
+        for (Future<Long> timing : timings) {{
+            latencies.add(timing.get());
+        }}
+        double elapsedSeconds = (System.nanoTime() - started) / 1e9;
+        executor.shutdown();
+
+        Collections.sort(latencies);
+        long p50 = latencies.get(latencies.size() / 2) / 1_000_000;
+        long p99 = latencies.get((int) (latencies.size() * 0.99)) / 1_000_000;
+        System.out.printf("hello: %d requests, %.0f req/s, p50=%dms, p99=%dms%n",
+            REQUESTS, REQUESTS / elapsedSeconds, p50, p99);
+
+        assertTrue(p99 <= P99_BUDGET_MS, "p99 latency " + p99 + "ms exceeds budget of " + P99_BUDGET_MS + "ms");
+    }}
+}}
+'''
+
+    @staticmethod
+    def get_application_properties(perf=False, datasource=None):
         """Generate application.properties"""
-        return '''# Server Configuration
+        properties = '''# Server Configuration
 server.port=8080
 
+# Embedded Tomcat
+server.tomcat.threads.max=${TOMCAT_MAX_THREADS:200}
+server.tomcat.threads.min-spare=${TOMCAT_MIN_SPARE_THREADS:10}
+server.tomcat.accept-count=${TOMCAT_ACCEPT_COUNT:100}
+server.tomcat.max-connections=${TOMCAT_MAX_CONNECTIONS:8192}
+server.tomcat.connection-timeout=${TOMCAT_CONNECTION_TIMEOUT:5s}
+server.tomcat.keep-alive-timeout=${TOMCAT_KEEP_ALIVE_TIMEOUT:20s}
+server.tomcat.max-keep-alive-requests=${TOMCAT_MAX_KEEP_ALIVE_REQUESTS:1000}
+
+# Response Compression
+server.compression.enabled=${SERVER_COMPRESSION_ENABLED:true}
+server.compression.min-response-size=${SERVER_COMPRESSION_MIN_RESPONSE_SIZE:1KB}
+server.compression.mime-types=application/json,application/xml,application/javascript,text/html,text/xml,text/plain,text/css
+
 # Actuator Configuration
 management.endpoints.web.exposure.include=health,info,metrics
 
@@ -175,86 +318,75 @@ server.error.include-stacktrace=never
 logging.level.root=INFO
 logging.level.com.example=DEBUG
 '''
+        if datasource:
+            properties += SpringModel.get_datasource_properties(datasource)
+        if perf:
+            properties += '''
+# Performance Profile
+# Run request handling on Java 21 virtual threads
+spring.threads.virtual.enabled=true
+# Defer bean creation until first use (faster startup, slower first request)
+spring.main.lazy-initialization=${SPRING_LAZY_INIT:false}
+'''
+        return properties
+
+    @staticmethod
+    def get_datasource_properties(datasource):
+        """Generate datasource and HikariCP pool properties"""
+        if datasource == 'mysql':
+            connection = '''# Datasource (aske sol mysql <name> listens on localhost:3306)
+spring.datasource.url=${DATABASE_URL:jdbc:mysql://localhost:3306/app?createDatabaseIfNotExist=true}
+spring.datasource.username=${DATABASE_USERNAME:root}
+spring.datasource.password=${DATABASE_PASSWORD:}
+'''
+            statement_cache = '''spring.datasource.hikari.data-source-properties.cachePrepStmts=true
+spring.datasource.hikari.data-source-properties.prepStmtCacheSize=${DB_PREP_STMT_CACHE_SIZE:250}
+spring.datasource.hikari.data-source-properties.prepStmtCacheSqlLimit=2048
+spring.datasource.hikari.data-source-properties.useServerPrepStmts=true
+'''
+        else:
+            connection = '''# Datasource (aske sol postgresql <name> listens on localhost:5432)
+spring.datasource.url=${DATABASE_URL:jdbc:postgresql://localhost:5432/postgres}
+spring.datasource.username=${DATABASE_USERNAME:postgres}
+spring.datasource.password=${DATABASE_PASSWORD:}
+'''
+            # pgjdbc's equivalents of Connector/J's prepStmtCacheSize
+            statement_cache = '''spring.datasource.hikari.data-source-properties.prepareThreshold=3
+spring.datasource.hikari.data-source-properties.preparedStatementCacheQueries=${DB_PREP_STMT_CACHE_SIZE:250}
+spring.datasource.hikari.data-source-properties.preparedStatementCacheSizeMiB=5
+'''
+        return f'''
+{connection}
+# HikariCP Connection Pool
+spring.datasource.hikari.maximum-pool-size=${{DB_POOL_MAX_SIZE:10}}
+spring.datasource.hikari.minimum-idle=${{DB_POOL_MIN_IDLE:10}}
+spring.datasource.hikari.connection-timeout=${{DB_POOL_CONNECTION_TIMEOUT:3000}}
+spring.datasource.hikari.validation-timeout=${{DB_POOL_VALIDATION_TIMEOUT:1000}}
+spring.datasource.hikari.idle-timeout=${{DB_POOL_IDLE_TIMEOUT:600000}}
+spring.datasource.hikari.max-lifetime=${{DB_POOL_MAX_LIFETIME:1800000}}
+spring.datasource.hikari.keepalive-time=${{DB_POOL_KEEPALIVE_TIME:300000}}
+{statement_cache}'''
 
     @staticmethod
     def get_java_gitignore():
         """Get standard Java .gitignore content"""
-        return '''# Compiled class files
-*.class
-
-# Log files
-*.log
-
-# BlueJ files
-*.ctxt
-
-# Mobile Tools for Java (J2ME)
-.mtj.tmp/
-
-# Package Files
-*.jar
-*.war
-*.nar
-*.ear
-*.zip
-*.tar.gz
-*.rar
-
-# virtual machine crash logs
-hs_err_pid*
-replay_pid*
-
-# Maven
-target/
-pom.xml.tag
-pom.xml.releaseBackup
-pom.xml.versionsBackup
-pom.xml.next
-release.properties
-dependency-reduced-pom.xml
-buildNumber.properties
-.mvn/timing.properties
-.mvn/wrapper/maven-wrapper.jar
-
-# Gradle
-.gradle/
-build/
-
-# IntelliJ IDEA
-.idea/
-*.iws
-*.iml
-*.ipr
-
-# Eclipse
-.settings/
-.classpath
-.project
-.factorypath
-
-# VS Code
-.vscode/
-
-# Mac
-.DS_Store
-
-# Spring Boot
-*.pid
-*.port
-'''
+        return load_template('spring/get_java_gitignore')
 
     @staticmethod
-    def get_readme(name):
+    def get_readme(name, perf=False):
         """Generate README.md content"""
+        java_version = '21' if perf else '17'
+        boot_version = '3.3' if perf else '3.2'
+        perf_section = SpringModel.get_perf_readme_section(name) if perf else ''
         return f'''# {name}
 
 A Spring Boot application created with ASKE.
 
 ## Requirements
 
-- Java 17+
+- Java {java_version}+
 - Maven 3.8+
-- Spring Boot 3.2+
+- Spring Boot {boot_version}+
 
 ## Setup
 
@@ -264,7 +396,7 @@ A Spring Boot application created with ASKE.
 java -version
 
 # Install Java if needed
-brew install openjdk@17
+brew install openjdk@{java_version}
 ```
 
 2. Build the project:
@@ -296,13 +428,34 @@ Run tests with:
 ./mvnw test
 ```
 
+## Benchmark
+
+`HelloControllerBenchmarkTest` is a smoke benchmark that fails if `/hello` p99
+latency exceeds `benchmark.p99.ms` (250 ms). Wall-clock budgets are unreliable on
+loaded CI machines, so `./mvnw test` skips it; run it on a quiet machine with:
+```bash
+./mvnw -Pbenchmark test -Dbenchmark.requests=10000
+```
+
+## Tuning
+
+Server and connection pool settings in `application.properties` read
+environment variables with sensible defaults, for example
+`TOMCAT_MAX_THREADS`, `TOMCAT_ACCEPT_COUNT`, `TOMCAT_KEEP_ALIVE_TIMEOUT`
+and, when a datasource is configured, `DATABASE_URL` and `DB_POOL_MAX_SIZE`.
+
 ## Code Quality
 
 Run checkstyle:
 ```bash
 ./mvnw checkstyle:check
 ```
-'''
+{perf_section}'''
+
+    @staticmethod
+    def get_perf_readme_section(name):
+        """Generate README section for the performance profile"""
+        return render_template('spring/get_perf_readme_section', name=name)
 
     @staticmethod
     def get_error_controller(name):
@@ -321,4 +474,27 @@ public class CustomErrorController implements ErrorController {{
         return "Error occurred! Please try /hello endpoint.";
     }}
 }}
-''' 
\ No newline at end of file
+''' 
+    @staticmethod
+    def get_project_renderers(name, perf=False, datasource=None):
+        """Map project-relative paths to functions rendering their contents"""
+        package_path = os.path.join("src", "main", "java", "com", "example", name.lower())
+        test_path = os.path.join("src", "test", "java", "com", "example", name.lower())
+        resources_path = os.path.join("src", "main", "resources")
+        return {
+            'pom.xml': lambda: SpringModel.get_pom_xml(name, perf=perf, datasource=datasource),
+            os.path.join(package_path, 'Application.java'): lambda: SpringModel.get_application_class(name),
+            os.path.join(package_path, 'controller', 'HelloController.java'): lambda: SpringModel.get_hello_controller(name),
+            os.path.join(package_path, 'controller', 'CustomErrorController.java'): lambda: SpringModel.get_error_controller(name),
+            os.path.join(test_path, 'ApplicationTests.java'): lambda: SpringModel.get_application_test(name),
+            os.path.join(test_path, 'controller', 'HelloControllerTest.java'): lambda: SpringModel.get_hello_controller_test(name),
+            os.path.join(test_path, 'controller', 'HelloControllerBenchmarkTest.java'): lambda: SpringModel.get_benchmark_test(name),
+            os.path.join(resources_path, 'application.properties'): lambda: SpringModel.get_application_properties(perf=perf, datasource=datasource),
+            'README.md': lambda: SpringModel.get_readme(name, perf=perf)
+        }
+
+    @staticmethod
+    def get_project_files(name, perf=False, datasource=None):
+        """Map project-relative paths to generated file contents"""
+        return {file_path: render() for file_path, render in
+                SpringModel.get_project_renderers(name, perf=perf, datasource=datasource).items()}
@@ -0,0 +1,143 @@
+"""Incremental ownership and permission checks for toolchain directories"""
+import json
+import os
+import stat
+import subprocess
+
+from aske.core.cache import cache_key, get_cache_dir
+
+# Bits every directory / file under a mode root must have (u+rwx,go+rx / u+rw,go+r)
+DIR_MODE = 0o755
+FILE_MODE = 0o644
+
+# Directories up to this depth below each root are recorded in the stamp.
+# Installing a Ruby or a gem adds entries at these levels, which bumps their mtime.
+STAMP_DEPTH = 3
+
+# Keep sudo command lines well below ARG_MAX
+CHOWN_BATCH = 500
+
+
+def _is_within(path, roots):
+    return any(path == root or path.startswith(root + os.sep) for root in roots)
+
+
+def _depth(path, roots):
+    """Smallest depth of path below any of the roots"""
+    depths = [path[len(root):].count(os.sep) for root in roots if _is_within(path, roots=[root])]
+    return min(depths) if depths else None
+
+
+def scan_tree(root, uid, mode_roots=()):
+    """Walk root once and collect entries that need fixing
+
+    Returns (not_owned, wrong_mode, dir_mtimes): paths not owned by uid, paths
+    under mode_roots missing DIR_MODE/FILE_MODE bits, and the mtimes of the
+    directories that make up the stamp.
+    """
+    root = os.path.abspath(root)
+    mode_roots = [os.path.abspath(path) for path in mode_roots]
+    stamp_roots = [root] + mode_roots
+    not_owned, wrong_mode, dir_mtimes = [], [], {}
+
+    root_stat = os.stat(root, follow_symlinks=False)
+    if root_stat.st_uid != uid:
+        not_owned.append(root)
+    dir_mtimes[root] = root_stat.st_mtime_ns
+
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_uid != uid:
+                        not_owned.append(entry.path)
+                    if stat.S_ISLNK(st.st_mode):
+                        continue
+
+                    is_dir = stat.S_ISDIR(st.st_mode)
+                    if _is_within(entry.path, mode_roots):
+                        required = DIR_MODE if is_dir else FILE_MODE
+                        if st.st_mode & required != required:
+                            wrong_mode.append((entry.path, stat.S_IMODE(st.st_mode) | required))
+
+                    if is_dir:
+                        stack.append(entry.path)
+                        depth = _depth(entry.path, stamp_roots)
+                        if depth is not None and depth <= STAMP_DEPTH:
+                            dir_mtimes[entry.path] = st.st_mtime_ns
+        except PermissionError:
+            # Unreadable directory: it needs a chown before it can be scanned
+            if current not in not_owned:
+                not_owned.append(current)
+
+    return not_owned, wrong_mode, dir_mtimes
+
+
+def _stamp_path(root, uid, mode_roots):
+    key = cache_key(os.path.abspath(root), uid, *sorted(os.path.abspath(path) for path in mode_roots))
+    return os.path.join(get_cache_dir('permissions'), f'{key}.json')
+
+
+def stamp_is_current(root, uid, mode_roots=()):
+    """Check whether nothing was added or removed since the last good scan"""
+    try:
+        with open(_stamp_path(root, uid, mode_roots)) as f:
+            dir_mtimes = json.load(f)['dirs']
+    except (OSError, ValueError, KeyError):
+        return False
+
+    for path, mtime_ns in dir_mtimes.items():
+        try:
+            st = os.stat(path, follow_symlinks=False)
+        except OSError:
+            return False
+        if st.st_mtime_ns != mtime_ns or st.st_uid != uid:
+            return False
+    return True
+
+
+def save_stamp(root, uid, mode_roots, dir_mtimes):
+    """Record the state of a tree that has just been verified"""
+    with open(_stamp_path(root, uid, mode_roots), 'w') as f:
+        json.dump({'root': os.path.abspath(root), 'dirs': dir_mtimes}, f)
+
+
+def fix_permissions(root, mode_roots=(), user=None, uid=None):
+    """Make root owned by user and mode_roots readable, touching only what is wrong
+
+    mode_roots must lie inside root. sudo is only invoked when some entry is
+    owned by someone else. Returns a summary dict with 'cached', 'chowned' and
+    'chmodded'; the stamp is only saved once the tree is fully clean.
+    """
+    user = user or os.environ['USER']
+    uid = os.getuid() if uid is None else uid
+
+    if stamp_is_current(root, uid, mode_roots):
+        return {'cached': True, 'chowned': 0, 'chmodded': 0}
+
+    not_owned, wrong_mode, dir_mtimes = scan_tree(root, uid, mode_roots)
+    chowned, chmodded = len(not_owned), len(wrong_mode)
+
+    for i in range(0, len(not_owned), CHOWN_BATCH):
+        subprocess.run(['sudo', 'chown', '-h', user] + not_owned[i:i + CHOWN_BATCH], check=True)
+
+    for path, mode in wrong_mode:
+        try:
+            os.chmod(path, mode)
+        except PermissionError:
+            subprocess.run(['sudo', 'chmod', format(mode, 'o'), path], check=True)
+
+    if not_owned:
+        # Directories that were unreadable before the chown have not been scanned yet
+        not_owned, wrong_mode, dir_mtimes = scan_tree(root, uid, mode_roots)
+        for path, mode in wrong_mode:
+            os.chmod(path, mode)
+        chmodded += len(wrong_mode)
+        if not_owned:
+            return {'cached': False, 'chowned': chowned, 'chmodded': chmodded}
+
+    save_stamp(root, uid, mode_roots, dir_mtimes)
+    return {'cached': False, 'chowned': chowned, 'chmodded': chmodded}
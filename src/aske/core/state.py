@@ -0,0 +1,121 @@
+"""Generation checkpoints that let `aske resume` continue an interrupted generator"""
+import json
+import os
+import shutil
+import tempfile
+
+from aske import __version__
+
+# Checkpoint file, relative to the project root
+STATE_PATH = os.path.join('.aske', 'state.json')
+
+
+class GenerationState:
+    """Steps a generator has completed in a project, persisted in .aske/state.json
+
+    The state records the generator command, the name it was given, the
+    directory it ran in and its options, so the same command can be run again
+    with resume=True and skip every completed step.
+    """
+
+    def __init__(self, project_path, command, name, options=None, cwd=None,
+                 completed=None, finished=False, version=__version__):
+        self.project_path = project_path
+        self.command = command
+        self.name = name
+        self.options = dict(options or {})
+        self.cwd = cwd or os.getcwd()
+        self.completed = [*(completed or [])]
+        self.finished = finished
+        self.version = version
+
+    @staticmethod
+    def get_path(project_path):
+        """Path of the checkpoint file of a project"""
+        return os.path.join(project_path, STATE_PATH)
+
+    @classmethod
+    def load(cls, project_path):
+        """Load a project's checkpoints; None if it has none
+
+        Raises ValueError if the checkpoint file is unreadable.
+        """
+        try:
+            with open(cls.get_path(project_path)) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Corrupt {STATE_PATH}: {e}")
+        if not isinstance(data, dict) or 'command' not in data or 'name' not in data:
+            raise ValueError(f"Corrupt {STATE_PATH}: missing command or name")
+        return cls(project_path, data['command'], data['name'], data.get('options'), data.get('cwd'),
+                   data.get('completed'), data.get('finished', False), data.get('version', __version__))
+
+    def to_dict(self):
+        return {
+            'command': self.command,
+            'name': self.name,
+            'options': self.options,
+            'cwd': self.cwd,
+            'completed': self.completed,
+            'finished': self.finished,
+            'version': self.version,
+        }
+
+    def save(self):
+        """Write the checkpoints atomically, so a crash never leaves half a file"""
+        path = self.get_path(self.project_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, staging = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write('\n')
+        os.replace(staging, path)
+
+    def begin(self):
+        """Create the project directory and record that generation started"""
+        os.makedirs(self.project_path, exist_ok=True)
+        self.save()
+
+    def clean(self):
+        """Remove everything but the checkpoints, e.g. a half-copied skeleton"""
+        keep = STATE_PATH.split(os.sep)[0]
+        for entry in os.listdir(self.project_path):
+            if entry == keep:
+                continue
+            path = os.path.join(self.project_path, entry)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+    def is_done(self, step):
+        """Check whether a step completed in an earlier run"""
+        return step in self.completed
+
+    def done(self, step):
+        """Record a completed step"""
+        if step not in self.completed:
+            self.completed.append(step)
+        self.save()
+
+    def finish(self):
+        """Record that every step completed"""
+        self.finished = True
+        self.save()
+
+    def get_resume_cwd(self):
+        """Directory the name resolves to the project from, or None if it was renamed
+
+        Usually the recorded directory; for a moved project, the directory
+        that now contains it under the same name.
+        """
+        project_path = os.path.abspath(self.project_path)
+        candidates = [self.cwd, project_path]
+        for _ in os.path.normpath(self.name).split(os.sep):
+            candidates[1] = os.path.dirname(candidates[1])
+        for cwd in candidates:
+            if os.path.abspath(os.path.join(cwd, self.name)) == project_path:
+                return cwd
+        return None
@@ -0,0 +1,97 @@
+"""Template pack: model templates shipped as package data and loaded on first use
+
+Templates live in aske/templates as one file per model method, e.g.
+go/gin/get_main_file.tmpl. Plain templates are returned verbatim, as a
+StaticTemplate that write_files copies straight from the pack; templates
+with placeholders use str.format syntax ({name}, with {{ and }} for literal
+braces) and are compiled once into a render function.
+"""
+import functools
+import os
+
+# Package and package-data directory holding the template files
+TEMPLATE_PACKAGE = 'aske'
+TEMPLATE_DIR = 'templates'
+
+# The pack on disk for regular installs; zipped installs go through importlib.resources
+TEMPLATE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), TEMPLATE_DIR)
+
+
+class StaticTemplate(str):
+    """Text of a template without placeholders, which is identical in every project
+
+    path is the template's file in the pack (None when the pack is not on disk),
+    so writers can copy the file instead of encoding the text again.
+    """
+
+    def __new__(cls, text, path=None):
+        template = super().__new__(cls, text)
+        template.path = path
+        return template
+
+
+def get_template_root():
+    """Get the template pack as a path, or as a Traversable when it is not on disk"""
+    if os.path.isdir(TEMPLATE_ROOT):
+        return TEMPLATE_ROOT
+    # Imported lazily: importlib.resources takes longer to import than every model
+    from importlib import resources
+    return resources.files(TEMPLATE_PACKAGE).joinpath(TEMPLATE_DIR)
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(name):
+    """Read a template from the pack, e.g. load_template('next/get_tsconfig')"""
+    root = get_template_root()
+    parts = f'{name}.tmpl'.split('/')
+    if isinstance(root, str):
+        path = os.path.join(root, *parts)
+        with open(path, encoding='utf-8') as f:
+            return StaticTemplate(f.read(), path)
+    for part in parts:
+        root = root.joinpath(part)
+    return StaticTemplate(root.read_text(encoding='utf-8'))
+
+
+def iter_templates():
+    """Yield the name of every template in the pack"""
+    root = get_template_root()
+    if isinstance(root, str):
+        for current, _, files in os.walk(root):
+            prefix = os.path.relpath(current, root).replace(os.sep, '/')
+            for file_name in files:
+                if file_name.endswith('.tmpl'):
+                    name = file_name[:-len('.tmpl')]
+                    yield name if prefix == '.' else f'{prefix}/{name}'
+        return
+
+    def walk(directory, prefix):
+        for entry in directory.iterdir():
+            if entry.is_dir():
+                yield from walk(entry, f'{prefix}{entry.name}/')
+            elif entry.name.endswith('.tmpl'):
+                yield prefix + entry.name[:-len('.tmpl')]
+
+    yield from walk(root, '')
+
+
+@functools.lru_cache(maxsize=None)
+def compile_template(name):
+    """Compile a template into a function rendering it from a {placeholder: value} mapping"""
+    import string
+    parts = []
+    for literal, field, _, _ in string.Formatter().parse(load_template(name)):
+        if literal:
+            parts.append((literal, None))
+        if field is not None:
+            parts.append((None, field))
+
+    def render(values):
+        return ''.join(literal if field is None else str(values[field]) for literal, field in parts)
+
+    return render
+
+
+def render_template(template, **values):
+    """Render a template with placeholders, e.g. render_template('go/base/get_mod_file', name=name)"""
+    return compile_template(template)(values)
@@ -0,0 +1,172 @@
+"""Resident aske server that runs CLI commands in forked, pre-warmed workers
+
+The daemon imports the CLI and every model once. Each aske-client connection
+is served by a fork that adopts the client's stdin/stdout/stderr (passed over
+the socket), cwd and environment, runs the command and reports its exit code.
+"""
+import importlib
+import os
+import pkgutil
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+
+from aske import __version__
+from aske.client import get_socket_path, recv_message, send_message
+
+
+def get_pid_path(socket_path=None):
+    """Path of the file holding the daemon's pid"""
+    return (socket_path or get_socket_path()) + '.pid'
+
+
+def is_running(socket_path=None):
+    """Check whether a daemon accepts connections on the socket"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path or get_socket_path())
+        return True
+    except OSError:
+        return False
+
+
+def get_pid(socket_path=None):
+    """Get the pid of the running daemon, or None"""
+    try:
+        with open(get_pid_path(socket_path)) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def preload():
+    """Import every model module and read the template pack so forked workers start warm"""
+    import aske.core.models as models
+    from aske.core.templates import iter_templates, load_template
+    for module in pkgutil.walk_packages(models.__path__, models.__name__ + '.'):
+        try:
+            importlib.import_module(module.name)
+        except ImportError:
+            continue
+    for template in iter_templates():
+        load_template(template)
+
+
+class CommandHandler(socketserver.BaseRequestHandler):
+    """Run one forwarded command; always executes inside a forked worker"""
+
+    def handle(self):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            message, fds = recv_message(self.request, maxfds=3)
+        except ConnectionError:
+            # Liveness check from is_running
+            return
+        if message.get('version') != __version__ or len(fds) != 3:
+            for fd in fds:
+                os.close(fd)
+            send_message(self.request, {'error': f"daemon runs aske {__version__}"})
+            return
+
+        # A session of its own: no job control on the client's terminal, and one
+        # process group to interrupt if the client goes away
+        os.setsid()
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, 'r', encoding='utf-8', closefd=False)
+        sys.stdout = open(1, 'w', encoding='utf-8', buffering=1, closefd=False)
+        sys.stderr = open(2, 'w', encoding='utf-8', buffering=1, closefd=False)
+        os.environ.clear()
+        os.environ.update(message['env'])
+        os.chdir(message['cwd'])
+
+        finished = threading.Event()
+        threading.Thread(target=self.watch_client, args=(finished,), daemon=True).start()
+        code = self.run_cli(message['argv'])
+        finished.set()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            send_message(self.request, {'exit': code})
+        except OSError:
+            pass
+
+    def run_cli(self, argv):
+        try:
+            self.server.cli.main(args=argv, prog_name='aske')
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        except KeyboardInterrupt:
+            return 130
+        except Exception:
+            traceback.print_exc()
+            return 1
+        return 0
+
+    def watch_client(self, finished):
+        """Interrupt the command, like Ctrl-C would, when the client disconnects"""
+        try:
+            self.request.recv(1)
+        except OSError:
+            pass
+        if not finished.is_set():
+            os.killpg(0, signal.SIGINT)
+
+
+class DaemonServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server forking one worker per command"""
+
+    def __init__(self, socket_path, cli):
+        self.cli = cli
+        super().__init__(socket_path, CommandHandler)
+
+    def process_request(self, request, client_address):
+        # Buffered daemon output must not leak into the worker's client
+        sys.stdout.flush()
+        sys.stderr.flush()
+        super().process_request(request, client_address)
+
+
+def _exit(signum, frame):
+    raise SystemExit(0)
+
+
+def serve(cli, socket_path=None):
+    """Serve the click group cli on the socket until SIGTERM
+
+    Returns False if another daemon is already listening.
+    """
+    socket_path = socket_path or get_socket_path()
+    if is_running(socket_path):
+        return False
+    os.makedirs(os.path.dirname(socket_path), mode=0o700, exist_ok=True)
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    preload()
+    umask = os.umask(0o177)
+    try:
+        server = DaemonServer(socket_path, cli)
+    finally:
+        os.umask(umask)
+    with open(get_pid_path(socket_path), 'w') as f:
+        f.write(str(os.getpid()))
+
+    signal.signal(signal.SIGTERM, _exit)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for path in (socket_path, get_pid_path(socket_path)):
+            if os.path.exists(path):
+                os.remove(path)
+    return True
@@ -0,0 +1,57 @@
+import functools
+import os
+import subprocess
+import sys
+
+import pytest
+
+from aske.core.engine import Engine, StepError, run_probes
+
+
+def test_run_probes_returns_timed_out_probes():
+    probes = run_probes({'slow': ['sleep', '5'], 'fast': ['true']}, timeout=0.5)
+
+    assert probes['fast'].ok
+    assert not probes['slow'].ok
+    assert probes['slow'].timed_out
+    assert probes['slow'].returncode is None
+    with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+        probes['slow'].check_found()
+    assert excinfo.value.cmd == ['sleep', '5']
+
+
+def test_run_probes_reports_missing_commands():
+    probes = run_probes({'missing': ['aske-no-such-command']})
+
+    assert not probes['missing'].timed_out
+    with pytest.raises(FileNotFoundError):
+        probes['missing'].check_found()
+
+
+def test_checked_step_timeout_raises():
+    engine = Engine().add('slow', command=['sleep', '5'], timeout=0.5)
+
+    with pytest.raises(StepError, match='timed out'):
+        engine.run()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="aske.cli needs Python 3.12")
+def test_cli_reports_timed_out_probe(tmp_path, monkeypatch):
+    from click.testing import CliRunner
+
+    import aske.cli
+
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    java = bin_dir / 'java'
+    java.write_text('#!/bin/sh\nexec sleep 30\n')
+    java.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv('ASKE_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(aske.cli, 'run_probes', functools.partial(aske.cli.run_probes, timeout=0.5))
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(aske.cli.main, ['java', 'demo'])
+
+    assert result.exception is None
+    assert '`java -version` did not answer within 0.5s' in result.output